@@ -38,14 +38,16 @@ setup(
     python_requires=">=3.10",
     install_requires=[
         "fastmcp>=0.1.0",
-        "httpx>=0.24.0",
+        "httpx[http2]>=0.24.0",
+        "orjson>=3.9.0",
         "pydantic>=2.0.0",
         "python-dotenv>=1.0.0",
+        "uvloop>=0.17.0; platform_system != 'Windows'",
     ],
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.26.0",
             "pytest-cov>=4.0.0",
             "black>=23.0.0",
             "ruff>=0.1.0",
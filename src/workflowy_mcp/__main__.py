@@ -1,13 +1,14 @@
 """Main entry point for WorkFlowy MCP Server."""
 
-import asyncio
-
+from workflowy_mcp.config import setup_event_loop
 from workflowy_mcp.server import mcp
 
 
 def main() -> None:
     """Run the MCP server."""
-    asyncio.run(mcp.run())  # type: ignore[func-returns-value]
+    setup_event_loop()
+    # FastMCP.run() starts and drives its own event loop
+    mcp.run()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,13 @@
 """WorkFlowy API client package."""
 
-from .api_client import WorkFlowyClient
+from .api_client import WorkFlowyClient, close_shared_client, get_shared_client
 from .rate_limit import AdaptiveRateLimiter, RateLimiter
 from .retry import RetryHandler, with_retry
 
 __all__ = [
     "WorkFlowyClient",
+    "get_shared_client",
+    "close_shared_client",
     "RetryHandler",
     "with_retry",
     "RateLimiter",
@@ -1,9 +1,13 @@
 """WorkFlowy API client implementation."""
 
-import json
-from typing import Any
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from types import MappingProxyType
+from typing import Any, NoReturn, TypeVar
 
 import httpx
+import orjson
 
 from ..models import (
     APIConfiguration,
@@ -17,6 +21,24 @@ from ..models import (
     TimeoutError,
     WorkFlowyNode,
 )
+from ..models.node import parse_node
+
+T = TypeVar("T")
+
+# Maximum number of ETag-validated GET responses kept per client
+_CACHE_MAX_SIZE = 1024
+
+
+def _parse_node_list(response_data: Any) -> list[WorkFlowyNode]:
+    """Build nodes from a list response body."""
+    # Assuming API returns an array of nodes directly
+    # (Need to verify actual response structure)
+    raw_nodes: list[Any] = []
+    if isinstance(response_data, dict):
+        raw_nodes = response_data.get("nodes", [])
+    elif isinstance(response_data, list):
+        raw_nodes = response_data
+    return [WorkFlowyNode.from_api(node) for node in raw_nodes]
 
 
 class WorkFlowyClient:
@@ -26,177 +48,286 @@ class WorkFlowyClient:
         """Initialize the WorkFlowy API client."""
         self.config = config
         self.base_url = config.base_url
-        self._client: httpx.AsyncClient | None = None
-
-    @property
-    def client(self) -> httpx.AsyncClient:
-        """Get or create the HTTP client."""
-        if self._client is None:
-            headers = {
-                "Authorization": f"Bearer {self.config.api_key.get_secret_value()}",
+        self._headers = MappingProxyType(
+            {
+                "Authorization": f"Bearer {config.api_key.get_secret_value()}",
                 "Content-Type": "application/json",
                 "Accept": "application/json",
             }
-            self._client = httpx.AsyncClient(
+        )
+        self.client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(config.max_concurrency)
+        # LRU of cache key -> (ETag, parsed result) for conditional GETs
+        self._cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client.
+
+        Construction never awaits, so the check-and-create runs atomically
+        on the event loop and concurrent first calls share one client.
+        """
+        if self.client is None:
+            self.client = httpx.AsyncClient(
                 base_url=self.base_url,
-                headers=headers,
-                timeout=httpx.Timeout(self.config.timeout),
+                headers=self._headers,
+                timeout=httpx.Timeout(self.config.timeout, connect=self.config.connect_timeout),
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry,
+                ),
+                http2=self.config.http2,
                 follow_redirects=True,
             )
-        return self._client
+        return self.client
 
     async def close(self) -> None:
         """Close the HTTP client."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        if self.client:
+            await self.client.aclose()
+            self.client = None
 
     async def __aenter__(self) -> "WorkFlowyClient":
         """Async context manager entry."""
+        self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Async context manager exit."""
         await self.close()
 
-    async def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle API response and errors."""
-        if response.status_code == 401:
-            raise AuthenticationError("Invalid API key or unauthorized access")
-
-        if response.status_code == 404:
-            raise NodeNotFoundError(
-                node_id=response.request.url.path.split("/")[-1], message="Resource not found"
-            )
-
-        if response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
-            raise RateLimitError(retry_after=int(retry_after) if retry_after else None)
+    @staticmethod
+    def _parse_ok(response: httpx.Response) -> Any:
+        """Decode the body of a successful (status < 400) response.
 
-        if response.status_code >= 500:
-            raise NetworkError(f"Server error: {response.status_code}")
+        Kept synchronous so the common path does not create a coroutine.
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
+            raise NetworkError("Invalid response format from API") from err
 
-        if response.status_code >= 400:
-            try:
-                error_data = response.json()
-                message = error_data.get("error", "API request failed")
-            except (json.JSONDecodeError, KeyError):
-                message = f"API error: {response.status_code}"
-            raise NetworkError(message)
+    async def _handle_error(self, response: httpx.Response) -> NoReturn:
+        """Raise the WorkFlowy error matching an unsuccessful response."""
+        status = response.status_code
+        match status:
+            case 401:
+                raise AuthenticationError("Invalid API key or unauthorized access")
+            case 404:
+                raise NodeNotFoundError(
+                    node_id=response.request.url.path.rsplit("/", 1)[-1],
+                    message="Resource not found",
+                )
+            case 429:
+                retry_after = response.headers.get("Retry-After")
+                raise RateLimitError(retry_after=int(retry_after) if retry_after else None)
+            case _ if status >= 500:
+                raise NetworkError(f"Server error: {status}")
 
         try:
-            return response.json()  # type: ignore[no-any-return]
-        except json.JSONDecodeError as err:
-            raise NetworkError("Invalid response format from API") from err
+            error_data = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            error_data = None
+        message = (
+            error_data.get("error", "API request failed")
+            if isinstance(error_data, dict)
+            else f"API error: {status}"
+        )
+        raise NetworkError(message)
 
-    async def create_node(self, request: NodeCreateRequest) -> WorkFlowyNode:
-        """Create a new node in WorkFlowy."""
+    async def _send(self, method: str, path: str, *, op: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, translating transport failures into WorkFlowy errors.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the API base URL
+            op: Operation name reported in timeout errors
+            **kwargs: Extra arguments passed to ``httpx.AsyncClient.request``
+        """
+        client = self.client or self._ensure_client()
         try:
-            response = await self.client.post("/nodes/", json=request.model_dump(exclude_none=True))
-            data = await self._handle_response(response)
-            # Create endpoint returns just {"item_id": "..."}
-            # We need to construct a minimal node response
-            item_id = data.get("item_id")
-            if not item_id:
-                raise NetworkError(f"Invalid response from create endpoint: {data}")
-
-            # Return a minimal node with just the ID and provided fields
-            node_data = {
-                "id": item_id,
-                "name": request.name,
-                "note": request.note,
-            }
-            if request.layoutMode:
-                node_data["data"] = {"layoutMode": request.layoutMode}
-            return WorkFlowyNode(**node_data)
+            # Bound in-flight requests so bursts queue here instead of at the server
+            async with self._semaphore:
+                return await client.request(method, path, **kwargs)
         except httpx.TimeoutException as err:
-            raise TimeoutError("create_node") from err
+            raise TimeoutError(op) from err
         except httpx.NetworkError as e:
             raise NetworkError(f"Network error: {str(e)}") from e
 
+    async def _request(self, method: str, path: str, *, op: str, **kwargs: Any) -> Any:
+        """Send a request and return the decoded response body."""
+        response = await self._send(method, path, op=op, **kwargs)
+        if response.status_code >= 400:
+            await self._handle_error(response)
+        return self._parse_ok(response)
+
+    async def _get_cached(
+        self,
+        path: str,
+        *,
+        op: str,
+        parse: Callable[[Any], T],
+        params: dict[str, Any] | None = None,
+    ) -> T:
+        """Issue a conditional GET, reusing the parsed result on 304 Not Modified.
+
+        Responses carrying an ETag are remembered and revalidated with
+        If-None-Match, so an unchanged resource costs one round trip with an
+        empty body and skips decoding and validation entirely.
+        """
+        key = str(httpx.URL(path, params=params))
+        cached = self._cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = await self._send("GET", path, op=op, params=params, headers=headers)
+        if cached and response.status_code == 304:
+            self._cache.move_to_end(key)
+            return cached[1]  # type: ignore[no-any-return]
+
+        etag = response.headers.get("ETag")
+        if response.status_code >= 400:
+            await self._handle_error(response)
+        data = self._parse_ok(response)
+        # Release the raw body before building models from the decoded data
+        del response
+        result = parse(data)
+        if etag:
+            self._cache[key] = (etag, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.pop(key, None)
+        return result
+
+    async def create_node(self, request: NodeCreateRequest) -> WorkFlowyNode:
+        """Create a new node in WorkFlowy."""
+        data = await self._request(
+            "POST",
+            "/nodes/",
+            op="create_node",
+            content=request.to_wire(),
+        )
+        # Create endpoint returns just {"item_id": "..."}
+        # We need to construct a minimal node response
+        item_id = data.get("item_id")
+        if not item_id:
+            raise NetworkError(f"Invalid response from create endpoint: {data}")
+
+        # Return a minimal node with just the ID and provided fields
+        node_data = {
+            "id": item_id,
+            "name": request.name,
+            "note": request.note,
+        }
+        if request.layoutMode:
+            node_data["data"] = {"layoutMode": request.layoutMode}
+        return parse_node(node_data)
+
     async def update_node(self, node_id: str, request: NodeUpdateRequest) -> WorkFlowyNode:
         """Update an existing node."""
-        try:
-            response = await self.client.post(
-                f"/nodes/{node_id}", json=request.model_dump(exclude_none=True)
-            )
-            data = await self._handle_response(response)
-            # API returns the full node object
-            return WorkFlowyNode(**data)
-        except httpx.TimeoutException as err:
-            raise TimeoutError("update_node") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        data = await self._request(
+            "POST",
+            f"/nodes/{node_id}",
+            op="update_node",
+            content=request.to_wire(),
+        )
+        # API returns the full node object
+        return WorkFlowyNode.from_api(data)
 
     async def get_node(self, node_id: str) -> WorkFlowyNode:
         """Retrieve a specific node by ID."""
-        try:
-            response = await self.client.get(f"/nodes/{node_id}")
-            data = await self._handle_response(response)
-            # API returns the full node object
-            return WorkFlowyNode(**data)
-        except httpx.TimeoutException as err:
-            raise TimeoutError("get_node") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        # API returns the full node object
+        return await self._get_cached(
+            f"/nodes/{node_id}", op="get_node", parse=WorkFlowyNode.from_api
+        )
 
     async def list_nodes(self, request: NodeListRequest) -> tuple[list[WorkFlowyNode], int]:
         """List nodes with optional filtering."""
-        try:
-            # exclude_none=True ensures parent_id is omitted entirely for root nodes
-            # (API requires absence of parameter, not null value)
-            params = request.model_dump(exclude_none=True)
-            response = await self.client.get("/nodes", params=params)
-            response_data: list[Any] | dict[str, Any] = await self._handle_response(response)
-
-            # Assuming API returns an array of nodes directly
-            # (Need to verify actual response structure)
-            nodes: list[WorkFlowyNode] = []
-            if isinstance(response_data, dict):
-                if "nodes" in response_data:
-                    nodes = [WorkFlowyNode(**node_data) for node_data in response_data["nodes"]]
-            elif isinstance(response_data, list):
-                nodes = [WorkFlowyNode(**node_data) for node_data in response_data]
-
-            total = len(nodes)  # API doesn't provide a total count
-            return nodes, total
-        except httpx.TimeoutException as err:
-            raise TimeoutError("list_nodes") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        # exclude_none=True ensures parent_id is omitted entirely for root nodes
+        # (API requires absence of parameter, not null value)
+        params = request.model_dump(exclude_none=True)
+        cached_nodes = await self._get_cached(
+            "/nodes", op="list_nodes", parse=_parse_node_list, params=params
+        )
+        # Hand out a copy so callers can't reorder the cached page
+        nodes = list(cached_nodes)
+
+        total = len(nodes)  # API doesn't provide a total count
+        return nodes, total
 
     async def delete_node(self, node_id: str) -> bool:
         """Delete a node and all its children."""
-        try:
-            response = await self.client.delete(f"/nodes/{node_id}")
-            # Delete endpoint returns just a message, not nested data
-            await self._handle_response(response)
-            return True
-        except httpx.TimeoutException as err:
-            raise TimeoutError("delete_node") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        # Delete endpoint returns just a message, not nested data
+        await self._request("DELETE", f"/nodes/{node_id}", op="delete_node")
+        return True
 
     async def complete_node(self, node_id: str) -> WorkFlowyNode:
         """Mark a node as completed."""
-        try:
-            response = await self.client.post(f"/nodes/{node_id}/complete")
-            data = await self._handle_response(response)
-            # API returns the full node object
-            return WorkFlowyNode(**data)
-        except httpx.TimeoutException as err:
-            raise TimeoutError("complete_node") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        data = await self._request("POST", f"/nodes/{node_id}/complete", op="complete_node")
+        # API returns the full node object
+        return WorkFlowyNode.from_api(data)
 
     async def uncomplete_node(self, node_id: str) -> WorkFlowyNode:
         """Mark a node as not completed."""
-        try:
-            response = await self.client.post(f"/nodes/{node_id}/uncomplete")
-            data = await self._handle_response(response)
-            # API returns the full node object
-            return WorkFlowyNode(**data)
-        except httpx.TimeoutException as err:
-            raise TimeoutError("uncomplete_node") from err
-        except httpx.NetworkError as e:
-            raise NetworkError(f"Network error: {str(e)}") from e
+        data = await self._request("POST", f"/nodes/{node_id}/uncomplete", op="uncomplete_node")
+        # API returns the full node object
+        return WorkFlowyNode.from_api(data)
+
+    async def get_nodes(self, node_ids: Iterable[str]) -> list[WorkFlowyNode | BaseException]:
+        """Retrieve several nodes concurrently.
+
+        Results are returned in input order; a failed lookup is returned in
+        place as its exception instead of aborting the whole batch.
+        """
+        return await asyncio.gather(
+            *(self.get_node(node_id) for node_id in node_ids),
+            return_exceptions=True,
+        )
+
+    async def delete_nodes(self, node_ids: Iterable[str]) -> list[bool | BaseException]:
+        """Delete several nodes concurrently."""
+        return await asyncio.gather(
+            *(self.delete_node(node_id) for node_id in node_ids),
+            return_exceptions=True,
+        )
+
+    async def complete_nodes(self, node_ids: Iterable[str]) -> list[WorkFlowyNode | BaseException]:
+        """Mark several nodes as completed concurrently."""
+        return await asyncio.gather(
+            *(self.complete_node(node_id) for node_id in node_ids),
+            return_exceptions=True,
+        )
+
+    async def uncomplete_nodes(
+        self, node_ids: Iterable[str]
+    ) -> list[WorkFlowyNode | BaseException]:
+        """Mark several nodes as not completed concurrently."""
+        return await asyncio.gather(
+            *(self.uncomplete_node(node_id) for node_id in node_ids),
+            return_exceptions=True,
+        )
+
+
+# Process-wide client shared by every tool invocation
+_shared_client: WorkFlowyClient | None = None
+
+
+def get_shared_client(config: APIConfiguration) -> WorkFlowyClient:
+    """Get the process-wide WorkFlowy client, creating it on first use.
+
+    Reusing one client keeps a single connection pool, and with it the
+    pooled TCP/TLS and HTTP/2 sessions, alive for the process lifetime.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = WorkFlowyClient(config)
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide WorkFlowy client if one was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.close()
+        _shared_client = None
@@ -8,6 +8,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Token bucket resolution: one token is _TOKEN_SCALE integer units
+_TOKEN_SCALE = 1_000_000_000_000
+
 
 class RateLimiter:
     """Token bucket rate limiter implementation."""
@@ -29,10 +32,12 @@ class RateLimiter:
         self.burst_size = burst_size or int(requests_per_second)
         self.retry_after_header = retry_after_header
 
-        # Token bucket implementation
-        self.tokens = float(self.burst_size)
+        # Token bucket implementation, kept in integer units of
+        # 1/_TOKEN_SCALE tokens against a monotonic nanosecond clock
         self.max_tokens = float(self.burst_size)
-        self.last_update = time.monotonic()
+        self._max_n = self.burst_size * _TOKEN_SCALE
+        self._tokens_n = self._max_n
+        self._last_ns = time.monotonic_ns()
         self.lock = asyncio.Lock()
 
         # Request history for sliding window
@@ -41,12 +46,50 @@ class RateLimiter:
         # Track retry-after if we hit rate limits
         self.retry_after_until: float | None = None
 
+    @property
+    def requests_per_second(self) -> float:
+        """Sustained request rate."""
+        return self._rate_milli / 1000
+
+    @requests_per_second.setter
+    def requests_per_second(self, value: float) -> None:
+        # Milli-requests per second: multiplied by elapsed nanoseconds this
+        # yields exactly the 1/_TOKEN_SCALE token units earned.
+        self._rate_milli = max(round(value * 1000), 1)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket."""
+        return self._tokens_n / _TOKEN_SCALE
+
+    @tokens.setter
+    def tokens(self, value: float) -> None:
+        self._tokens_n = round(value * _TOKEN_SCALE)
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update to the bucket."""
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - self._last_ns
+        self._last_ns = now_ns
+        self._tokens_n = min(self._tokens_n + elapsed_ns * self._rate_milli, self._max_n)
+
     async def acquire(self, cost: float = 1.0) -> None:
         """Acquire permission to make a request.
 
         Args:
             cost: Number of tokens to consume (default 1.0)
         """
+        # Fast path: tokens are available, no retry-after is pending and no
+        # other caller is queued. Nothing here awaits, so the check and the
+        # decrement run atomically on the event loop without taking the lock.
+        cost_n = round(cost * _TOKEN_SCALE)
+        if not self.retry_after_until and not self.lock.locked():
+            self._refill()
+            if self._tokens_n >= cost_n:
+                self._tokens_n -= cost_n
+                self._record_request()
+                return
+
         async with self.lock:
             # Check if we're in a retry-after period
             if self.retry_after_until:
@@ -54,35 +97,37 @@ class RateLimiter:
                 if wait_time > 0:
                     logger.info(f"Rate limited, waiting {wait_time:.1f}s")
                     await asyncio.sleep(wait_time)
-                    self.retry_after_until = None
+                self.retry_after_until = None
 
             # Update token bucket
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.last_update = now
-
-            # Add tokens based on elapsed time
-            tokens_to_add = elapsed * self.requests_per_second
-            self.tokens = min(self.tokens + tokens_to_add, self.max_tokens)
+            self._refill()
 
             # Wait if not enough tokens
-            if self.tokens < cost:
-                wait_time = (cost - self.tokens) / self.requests_per_second
+            if self._tokens_n < cost_n:
+                wait_ns = -(-(cost_n - self._tokens_n) // self._rate_milli)
+                wait_time = wait_ns / 1e9
                 logger.debug(f"Rate limiting: waiting {wait_time:.3f}s")
                 await asyncio.sleep(wait_time)
 
                 # Update tokens after waiting
-                now = time.monotonic()
-                elapsed = now - self.last_update
-                self.last_update = now
-                tokens_to_add = elapsed * self.requests_per_second
-                self.tokens = min(self.tokens + tokens_to_add, self.max_tokens)
+                self._refill()
 
             # Consume tokens
-            self.tokens -= cost
+            self._tokens_n -= cost_n
 
             # Track request time
-            self.request_times.append(time.time())
+            self._record_request()
+
+    def _record_request(self) -> None:
+        """Track a request time and drop entries outside the one-minute window."""
+        now = time.time()
+        self.request_times.append(now)
+        self._evict_expired(now)
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop request times older than the one-minute rate window."""
+        while self.request_times and now - self.request_times[0] >= 60:
+            self.request_times.popleft()
 
     def set_retry_after(self, seconds: int) -> None:
         """Set retry-after period from server response.
@@ -96,25 +141,21 @@ class RateLimiter:
 
     def get_current_rate(self) -> float:
         """Get the current request rate (requests per second)."""
-        if len(self.request_times) < 2:
-            return 0.0
-
         now = time.time()
-        # Filter requests in the last minute
-        recent_requests = [t for t in self.request_times if now - t < 60]
+        self._evict_expired(now)
 
-        if len(recent_requests) < 2:
+        if len(self.request_times) < 2:
             return 0.0
 
-        time_span = now - recent_requests[0]
+        time_span = now - self.request_times[0]
         if time_span > 0:
-            return float(len(recent_requests) / time_span)
+            return float(len(self.request_times) / time_span)
         return 0.0
 
     def reset(self) -> None:
         """Reset the rate limiter state."""
-        self.tokens = float(self.max_tokens)
-        self.last_update = time.monotonic()
+        self._tokens_n = self._max_n
+        self._last_ns = time.monotonic_ns()
         self.request_times.clear()
         self.retry_after_until = None
 
@@ -160,5 +201,10 @@ class AdaptiveRateLimiter(RateLimiter):
             logger.warning(f"Reducing rate limit to {new_rate:.1f} req/s")
             self.requests_per_second = new_rate
 
+        # Drain the bucket so the saved-up burst is not spent straight into
+        # the limit that was just hit
+        self._refill()
+        self._tokens_n = 0
+
         if retry_after:
             self.set_retry_after(retry_after)
@@ -24,28 +24,47 @@ class RetryHandler:
         max_delay: float = 60.0,
         exponential_base: float = 2.0,
         jitter: bool = True,
+        rng: random.Random | None = None,
     ):
-        """Initialize retry handler."""
+        """Initialize retry handler.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            base_delay: Initial (and minimum jittered) delay in seconds
+            max_delay: Upper bound for any single delay in seconds
+            exponential_base: Growth factor of the un-jittered backoff
+            jitter: Whether to apply decorrelated jitter
+            rng: Random source for jitter (injectable for deterministic tests)
+        """
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.exponential_base = exponential_base
         self.jitter = jitter
+        self._random = rng or random.Random()
+        # Bound once so jittered retries skip the attribute lookups
+        self._uniform = self._random.uniform
 
-    def calculate_delay(self, attempt: int) -> float:
-        """Calculate delay for the given attempt number."""
-        # Exponential backoff
-        delay = min(self.base_delay * (self.exponential_base**attempt), self.max_delay)
+    def calculate_delay(self, attempt: int, prev_delay: float | None = None) -> float:
+        """Calculate delay for the given attempt number.
 
-        # Add jitter to prevent thundering herd
+        Args:
+            attempt: Zero-based retry attempt
+            prev_delay: Delay used for the previous attempt, if any
+        """
         if self.jitter:
-            delay = delay * (0.5 + random.random())
+            # Decorrelated jitter: draw between the base delay and three times
+            # the previous delay so concurrent clients spread their retries
+            upper = min(self.max_delay, (prev_delay or self.base_delay) * 3)
+            return self._uniform(self.base_delay, upper)
 
-        return delay
+        # Exponential backoff
+        return min(self.base_delay * (self.exponential_base**attempt), self.max_delay)
 
     async def execute_with_retry(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute a function with retry logic."""
         last_exception = None
+        delay: float | None = None
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -55,7 +74,7 @@ class RetryHandler:
                 last_exception = e
                 if attempt < self.max_retries:
                     # Use retry_after if provided, otherwise exponential backoff
-                    delay = e.details.get("retry_after", self.calculate_delay(attempt))
+                    delay = e.details.get("retry_after") or self.calculate_delay(attempt, delay)
                     logger.warning(
                         f"Rate limit hit, retrying in {delay:.1f}s "
                         f"(attempt {attempt + 1}/{self.max_retries + 1})"
@@ -68,7 +87,7 @@ class RetryHandler:
             except (NetworkError, TimeoutError) as e:
                 last_exception = e  # type: ignore[assignment]
                 if attempt < self.max_retries:
-                    delay = self.calculate_delay(attempt)
+                    delay = self.calculate_delay(attempt, delay)
                     logger.warning(
                         f"Network/timeout error, retrying in {delay:.1f}s "
                         f"(attempt {attempt + 1}/{self.max_retries + 1}): {str(e)}"
@@ -95,11 +114,15 @@ def with_retry(
     """Decorator to add retry logic to async functions."""
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Nothing to retry, so leave the function as-is
+        if max_retries <= 0:
+            return func
+
+        # The handler keeps no per-call state, so one instance serves every call
+        handler = RetryHandler(max_retries=max_retries, base_delay=base_delay, max_delay=max_delay)
+
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            handler = RetryHandler(
-                max_retries=max_retries, base_delay=base_delay, max_delay=max_delay
-            )
             return await handler.execute_with_retry(func, *args, **kwargs)
 
         return wrapper
@@ -1,5 +1,6 @@
 """Configuration management for WorkFlowy MCP server."""
 
+import asyncio
 import logging
 import logging.handlers
 import os
@@ -18,6 +19,9 @@ if os.getenv("WORKFLOWY_DEV_MODE") or os.getenv("WORKFLOWY_LOAD_ENV"):
         # python-dotenv is optional - only needed for development
         pass
 
+# Attribute marking root handlers installed by setup_logging
+_HANDLER_TAG = "_workflowy_mcp"
+
 
 def setup_logging(config: ServerConfig | None = None) -> None:
     """Setup logging configuration.
@@ -31,11 +35,9 @@ def setup_logging(config: ServerConfig | None = None) -> None:
             config = ServerConfig()  # type: ignore[call-arg]
         except Exception:
             # If config loading fails, use defaults
-            log_level = os.getenv("LOG_LEVEL", "INFO")
-            log_file = os.getenv("LOG_FILE")
-    else:
-        log_level = config.log_level
-        log_file = os.getenv("LOG_FILE")
+            config = None
+    log_level = config.log_level if config is not None else os.getenv("LOG_LEVEL", "INFO")
+    log_file = os.getenv("LOG_FILE")
 
     # Convert log level string to logging constant
     level_map = {
@@ -53,9 +55,20 @@ def setup_logging(config: ServerConfig | None = None) -> None:
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
-    # Remove existing handlers
+    # Handlers installed by a previous call are tagged with what they write to;
+    # reuse matching ones and close the rest instead of rebuilding them
+    wanted = {"console"}
+    if log_file:
+        wanted.add(f"file:{Path(log_file).resolve()}")
+    reused: dict[str, logging.Handler] = {}
     for handler in root_logger.handlers[:]:
+        tag = getattr(handler, _HANDLER_TAG, None)
+        if tag in wanted:
+            reused[tag] = handler
+            continue
         root_logger.removeHandler(handler)
+        if tag is not None:
+            handler.close()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -63,25 +76,32 @@ def setup_logging(config: ServerConfig | None = None) -> None:
     )
 
     # Add console handler
-    console_handler = logging.StreamHandler()
+    console_handler = reused.get("console")
+    if console_handler is None:
+        console_handler = logging.StreamHandler()
+        setattr(console_handler, _HANDLER_TAG, "console")
+        root_logger.addHandler(console_handler)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # Add file handler if configured
     if log_file:
         try:
             # Create log directory if needed
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Use rotating file handler
-            file_handler = logging.handlers.RotatingFileHandler(
-                log_file, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
-            )
+            log_path = Path(log_file).resolve()
+            file_tag = f"file:{log_path}"
+            file_handler = reused.get(file_tag)
+            if file_handler is None:
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Use rotating file handler
+                file_handler = logging.handlers.RotatingFileHandler(
+                    log_path, maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
+                )
+                setattr(file_handler, _HANDLER_TAG, file_tag)
+                root_logger.addHandler(file_handler)
             file_handler.setLevel(log_level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
         except Exception as e:
             logging.warning(f"Failed to setup file logging: {str(e)}")
 
@@ -90,3 +110,16 @@ def setup_logging(config: ServerConfig | None = None) -> None:
     logging.getLogger("httpcore").setLevel(logging.WARNING)
 
     logging.info(f"Logging configured at level: {logging.getLevelName(log_level)}")
+
+
+def setup_event_loop() -> None:
+    """Use uvloop for new asyncio event loops when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows - fall back to the default loop
+        return
+
+    # uvloop.install() is deprecated on Python 3.12+. FastMCP creates its loop
+    # inside anyio.run, so the event loop policy is what reaches it.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,8 +1,9 @@
 """Error handling middleware for WorkFlowy MCP Server."""
 
-import traceback
+import logging
 from collections.abc import Callable
 from functools import wraps
+from types import MappingProxyType
 from typing import Any
 
 import httpx
@@ -15,6 +16,87 @@ from workflowy_mcp.models.errors import (
     WorkFlowyError,
 )
 
+logger = logging.getLogger(__name__)
+
+
+def _validation_error(e: ValidationError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "validation_error",
+        "message": str(e),
+        "field": e.details.get("field"),
+        "constraint": e.details.get("constraint"),
+    }
+
+
+def _authentication_error(e: AuthenticationError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "authentication_error",
+        "message": str(e),
+    }
+
+
+def _rate_limit_error(e: RateLimitError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "rate_limit_error",
+        "message": str(e),
+        "retry_after": e.details.get("retry_after", 60),
+    }
+
+
+def _api_error(e: APIError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "api_error",
+        "message": str(e),
+        "status_code": getattr(e, "status_code", None),
+    }
+
+
+def _network_error(e: httpx.NetworkError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "network_error",
+        "message": f"Network connection failed: {str(e)}",
+    }
+
+
+def _timeout_error(e: httpx.TimeoutException) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "timeout_error",
+        "message": f"Request timed out: {str(e)}",
+    }
+
+
+def _http_error(e: httpx.HTTPStatusError) -> dict[str, Any]:
+    return {
+        "success": False,
+        "error": "http_error",
+        "message": f"HTTP {e.response.status_code}: {str(e)}",
+        "status_code": e.response.status_code,
+    }
+
+
+def _workflowy_error(e: WorkFlowyError) -> dict[str, Any]:
+    return {"success": False, "error": "workflowy_error", "message": str(e)}
+
+
+# Error response builders keyed by exception class; the nearest class in an
+# exception's MRO wins, matching the order of the former except ladder
+_HANDLERS: dict[type[BaseException], Callable[[Any], dict[str, Any]]] = {
+    ValidationError: _validation_error,
+    AuthenticationError: _authentication_error,
+    RateLimitError: _rate_limit_error,
+    APIError: _api_error,
+    httpx.NetworkError: _network_error,
+    httpx.TimeoutException: _timeout_error,
+    httpx.HTTPStatusError: _http_error,
+    WorkFlowyError: _workflowy_error,
+}
+
 
 def error_handler(func: Callable) -> Callable:
     """Decorator to handle errors in MCP tool functions."""
@@ -23,59 +105,14 @@ def error_handler(func: Callable) -> Callable:
     async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
         try:
             return await func(*args, **kwargs)  # type: ignore[no-any-return]
-        except ValidationError as e:
-            return {
-                "success": False,
-                "error": "validation_error",
-                "message": str(e),
-                "field": getattr(e, "field", None),
-                "constraint": getattr(e, "constraint", None),
-            }
-        except AuthenticationError as e:
-            return {
-                "success": False,
-                "error": "authentication_error",
-                "message": str(e),
-                "realm": getattr(e, "realm", "WorkFlowy API"),
-            }
-        except RateLimitError as e:
-            return {
-                "success": False,
-                "error": "rate_limit_error",
-                "message": str(e),
-                "retry_after": getattr(e, "retry_after", 60),
-            }
-        except APIError as e:
-            return {
-                "success": False,
-                "error": "api_error",
-                "message": str(e),
-                "status_code": getattr(e, "status_code", None),
-            }
-        except httpx.NetworkError as e:
-            return {
-                "success": False,
-                "error": "network_error",
-                "message": f"Network connection failed: {str(e)}",
-            }
-        except httpx.TimeoutException as e:
-            return {
-                "success": False,
-                "error": "timeout_error",
-                "message": f"Request timed out: {str(e)}",
-            }
-        except httpx.HTTPStatusError as e:
-            return {
-                "success": False,
-                "error": "http_error",
-                "message": f"HTTP {e.response.status_code}: {str(e)}",
-                "status_code": e.response.status_code,
-            }
-        except WorkFlowyError as e:
-            return {"success": False, "error": "workflowy_error", "message": str(e)}
         except Exception as e:
+            for cls in type(e).__mro__:
+                handler = _HANDLERS.get(cls)
+                if handler is not None:
+                    return handler(e)
+
             # Log the full traceback for debugging
-            traceback.print_exc()
+            logger.exception("Unhandled error in MCP tool")
             return {
                 "success": False,
                 "error": "internal_error",
@@ -99,8 +136,14 @@ class ErrorMiddleware:
         self.error_types[error_type] = self.error_types.get(error_type, 0) + 1
 
     def get_error_stats(self) -> dict[str, Any]:
-        """Get error statistics."""
-        return {"total_errors": self.error_count, "error_types": self.error_types.copy()}
+        """Get error statistics.
+
+        ``error_types`` is a read-only live view rather than a snapshot.
+        """
+        return {
+            "total_errors": self.error_count,
+            "error_types": MappingProxyType(self.error_types),
+        }
 
     def reset_stats(self) -> None:
         """Reset error statistics."""
@@ -124,7 +167,9 @@ class ErrorMiddleware:
         # Add context to the response
         response = {
             "success": False,
-            "error": error_type.lower(),
+            "error": (
+                error.error_type if isinstance(error, WorkFlowyError) else error_type.lower()
+            ),
             "message": str(error),
             "context": context,
         }
@@ -134,10 +179,10 @@ class ErrorMiddleware:
             response["status_code"] = error.response.status_code
             response["response_body"] = error.response.text[:500]  # Limit size
         elif isinstance(error, RateLimitError):
-            response["retry_after"] = getattr(error, "retry_after", 60)
+            response["retry_after"] = error.details.get("retry_after", 60)
         elif isinstance(error, ValidationError):
-            response["field"] = getattr(error, "field", None)
-            response["value"] = getattr(error, "value", None)
+            response["field"] = error.details.get("field")
+            response["value"] = error.details.get("value")
 
         return response
 
@@ -3,16 +3,13 @@
 import json
 import logging
 import time
+from collections import deque
 from collections.abc import Callable
-from datetime import datetime
 from functools import wraps
+from itertools import islice
 from typing import Any
 
-# Configure structured logging
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
+# Handlers and levels are configured once by config.setup_logging()
 logger = logging.getLogger("workflowy_mcp")
 
 
@@ -24,36 +21,37 @@ def log_request_response(func: Callable) -> Callable:
         start_time = time.time()
         request_id = f"{func.__name__}_{int(start_time * 1000)}"
 
-        # Log the request
-        logger.info(
-            "Request received",
-            extra={
-                "request_id": request_id,
-                "tool": func.__name__,
-                "args": _sanitize_for_logging(args),
-                "kwargs": _sanitize_for_logging(kwargs),
-            },
-        )
-
-        try:
-            # Execute the function
-            result = await func(*args, **kwargs)
-
-            # Calculate execution time
-            execution_time = time.time() - start_time
-
-            # Log the response
+        # Log the request (skip building the record when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "Request completed",
+                "Request received",
                 extra={
                     "request_id": request_id,
                     "tool": func.__name__,
-                    "execution_time": f"{execution_time:.3f}s",
-                    "success": result.get("success", False),
-                    "response_size": len(json.dumps(result)),
+                    "args": _sanitize_for_logging(args),
+                    "kwargs": _sanitize_for_logging(kwargs),
                 },
             )
 
+        try:
+            # Execute the function
+            result = await func(*args, **kwargs)
+
+            # Log the response; serializing it for its size is only worth it
+            # when the record will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                execution_time = time.time() - start_time
+                logger.info(
+                    "Request completed",
+                    extra={
+                        "request_id": request_id,
+                        "tool": func.__name__,
+                        "execution_time": f"{execution_time:.3f}s",
+                        "success": result.get("success", False),
+                        "response_size": len(json.dumps(result)),
+                    },
+                )
+
             return result  # type: ignore[no-any-return]
 
         except Exception as e:
@@ -78,39 +76,65 @@ def log_request_response(func: Callable) -> Callable:
     return wrapper
 
 
+_SENSITIVE_KEYS: frozenset[str] = frozenset({"api_key", "password", "token", "secret"})
+
+
 def _sanitize_for_logging(data: Any, max_length: int = 200) -> Any:
     """
     Sanitize data for logging by removing sensitive information
     and limiting size.
     """
-    if isinstance(data, dict):
-        sanitized = {}
-        for key, value in data.items():
-            # Hide sensitive fields
-            if key.lower() in ["api_key", "password", "token", "secret"]:
-                sanitized[key] = "***REDACTED***"
-            else:
-                sanitized[key] = _sanitize_for_logging(value, max_length)
-        return sanitized
-    elif isinstance(data, list | tuple):
-        return [_sanitize_for_logging(item, max_length) for item in data[:10]]  # Limit array size
-    elif isinstance(data, str):
-        if len(data) > max_length:
-            return data[:max_length] + "..."
-        return data
-    else:
-        return data
+    # Walk nested containers with an explicit stack: each entry is a source
+    # value, the container and slot its sanitized copy is written to, and the
+    # ids of the containers enclosing it, so self-references end the walk.
+    root: list[Any] = [None]
+    stack: list[tuple[Any, Any, Any, frozenset[int]]] = [(data, root, 0, frozenset())]
+    while stack:
+        value, target, slot, ancestors = stack.pop()
+        if isinstance(value, dict | list | tuple):
+            if id(value) in ancestors:
+                target[slot] = "<cycle>"
+                continue
+            ancestors = ancestors | {id(value)}
+        if isinstance(value, dict):
+            sanitized: dict[Any, Any] = {}
+            for key, item in value.items():
+                # Hide sensitive fields
+                if key.lower() in _SENSITIVE_KEYS:
+                    sanitized[key] = "***REDACTED***"
+                else:
+                    sanitized[key] = None
+                    stack.append((item, sanitized, key, ancestors))
+            target[slot] = sanitized
+        elif isinstance(value, list | tuple):
+            items = list(value[:10])  # Limit array size
+            for index, item in enumerate(items):
+                stack.append((item, items, index, ancestors))
+            target[slot] = items
+        elif isinstance(value, str) and len(value) > max_length:
+            target[slot] = value[:max_length] + "..."
+        else:
+            target[slot] = value
+    return root[0]
 
 
 class LoggingMiddleware:
     """Middleware class for structured logging across the MCP server."""
 
-    def __init__(self, log_level: str = "INFO"):
-        """Initialize logging middleware."""
+    def __init__(self, log_level: str | None = None):
+        """Initialize logging middleware.
+
+        Args:
+            log_level: Level override for the ``workflowy_mcp`` logger; by
+                default the level configured by ``setup_logging`` is inherited
+        """
         self.logger = logging.getLogger("workflowy_mcp")
-        self.logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+        if log_level is not None:
+            self.logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
         self.request_count = 0
-        self.request_times: list[float] = []
+        # Recent execution times with a running total for the average
+        self.request_times: deque[float] = deque(maxlen=1000)
+        self._request_time_total = 0.0
         self.tool_usage: dict[str, int] = {}
 
     def log_request(
@@ -128,15 +152,15 @@ class LoggingMiddleware:
         self.request_count += 1
         self.tool_usage[tool_name] = self.tool_usage.get(tool_name, 0) + 1
 
-        self.logger.info(
-            f"Tool request: {tool_name}",
-            extra={
-                "request_id": request_id,
-                "tool": tool_name,
-                "params": _sanitize_for_logging(params),
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Tool request: {tool_name}",
+                extra={
+                    "request_id": request_id,
+                    "tool": tool_name,
+                    "params": _sanitize_for_logging(params),
+                },
+            )
 
         return request_id
 
@@ -144,19 +168,22 @@ class LoggingMiddleware:
         self, request_id: str, tool_name: str, response: dict[str, Any], execution_time: float
     ) -> None:
         """Log a response."""
+        if len(self.request_times) == self.request_times.maxlen:
+            self._request_time_total -= self.request_times[0]
         self.request_times.append(execution_time)
+        self._request_time_total += execution_time
 
-        self.logger.info(
-            f"Tool response: {tool_name}",
-            extra={
-                "request_id": request_id,
-                "tool": tool_name,
-                "success": response.get("success", False),
-                "execution_time": f"{execution_time:.3f}s",
-                "response_size": len(json.dumps(response)),
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-        )
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                f"Tool response: {tool_name}",
+                extra={
+                    "request_id": request_id,
+                    "tool": tool_name,
+                    "success": response.get("success", False),
+                    "execution_time": f"{execution_time:.3f}s",
+                    "response_size": len(json.dumps(response)),
+                },
+            )
 
     def log_error(
         self, request_id: str, tool_name: str, error: Exception, execution_time: float
@@ -170,19 +197,20 @@ class LoggingMiddleware:
                 "error_type": type(error).__name__,
                 "error_message": str(error),
                 "execution_time": f"{execution_time:.3f}s",
-                "timestamp": datetime.utcnow().isoformat(),
             },
             exc_info=True,
         )
 
     def get_stats(self) -> dict[str, Any]:
         """Get logging statistics."""
-        avg_time = sum(self.request_times) / len(self.request_times) if self.request_times else 0
+        count = len(self.request_times)
+        avg_time = self._request_time_total / count if count else 0
+        recent = list(islice(reversed(self.request_times), 10))[::-1]
         return {
             "total_requests": self.request_count,
             "average_execution_time": f"{avg_time:.3f}s",
             "tool_usage": self.tool_usage.copy(),
-            "recent_execution_times": self.request_times[-10:],  # Last 10 requests
+            "recent_execution_times": recent,  # Last 10 requests
         }
 
     def log_server_start(self, config: dict[str, Any]) -> None:
@@ -191,7 +219,6 @@ class LoggingMiddleware:
             "WorkFlowy MCP Server started",
             extra={
                 "config": _sanitize_for_logging(config),
-                "timestamp": datetime.utcnow().isoformat(),
             },
         )
 
@@ -200,7 +227,7 @@ class LoggingMiddleware:
         stats = self.get_stats()
         self.logger.info(
             "WorkFlowy MCP Server stopped",
-            extra={"stats": stats, "timestamp": datetime.utcnow().isoformat()},
+            extra={"stats": stats},
         )
 
 
@@ -1,25 +1,53 @@
-"""WorkFlowy MCP models package."""
-
-from .config import APIConfiguration
-from .errors import (
-    AuthenticationError,
-    ErrorResponse,
-    NetworkError,
-    NodeNotFoundError,
-    RateLimitError,
-    TimeoutError,
-    ValidationError,
-    WorkFlowyError,
-)
-from .node import WorkFlowyNode
-from .requests import (
-    DeleteResponse,
-    NodeCreateRequest,
-    NodeListRequest,
-    NodeListResponse,
-    NodeResponse,
-    NodeUpdateRequest,
-)
+"""WorkFlowy MCP models package.
+
+Models are imported lazily on first attribute access so that importing one
+model does not build every Pydantic class in the package.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import APIConfiguration
+    from .errors import (
+        AuthenticationError,
+        ErrorResponse,
+        NetworkError,
+        NodeNotFoundError,
+        RateLimitError,
+        TimeoutError,
+        ValidationError,
+        WorkFlowyError,
+    )
+    from .node import WorkFlowyNode
+    from .requests import (
+        DeleteResponse,
+        NodeCreateRequest,
+        NodeListRequest,
+        NodeListResponse,
+        NodeResponse,
+        NodeUpdateRequest,
+    )
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "WorkFlowyNode": "node",
+    "NodeCreateRequest": "requests",
+    "NodeUpdateRequest": "requests",
+    "NodeListRequest": "requests",
+    "NodeResponse": "requests",
+    "NodeListResponse": "requests",
+    "DeleteResponse": "requests",
+    "APIConfiguration": "config",
+    "ErrorResponse": "errors",
+    "WorkFlowyError": "errors",
+    "AuthenticationError": "errors",
+    "NodeNotFoundError": "errors",
+    "ValidationError": "errors",
+    "RateLimitError": "errors",
+    "NetworkError": "errors",
+    "TimeoutError": "errors",
+}
 
 __all__ = [
     # Node model
@@ -43,3 +71,19 @@ __all__ = [
     "NetworkError",
     "TimeoutError",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public model on first access and cache it on the package."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily exported names alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
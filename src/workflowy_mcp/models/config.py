@@ -1,16 +1,35 @@
 """Configuration models for WorkFlowy MCP server."""
 
-from pydantic import BaseModel, Field, SecretStr, field_validator
-from pydantic_settings import BaseSettings
+import re
+
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, SecretStr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+# An https:// URL with a non-empty host
+_HTTPS_URL_RE = re.compile(r"^https://[^/\s]+")
 
 
 class APIConfiguration(BaseModel):
     """Server configuration for WorkFlowy API access."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: SecretStr = Field(..., description="WorkFlowy API authentication key")
     base_url: str = Field("https://workflowy.com/api/v1", description="API base URL")
     timeout: int = Field(30, gt=0, description="Request timeout in seconds")
+    connect_timeout: float = Field(
+        5.0, gt=0, description="Seconds allowed to establish a connection"
+    )
     max_retries: int = Field(3, ge=0, description="Maximum retry attempts")
+    http2: bool = Field(True, description="Negotiate HTTP/2 with the API host")
+    max_connections: int = Field(100, gt=0, description="Maximum open connections in the pool")
+    max_keepalive_connections: int = Field(
+        20, ge=0, description="Maximum idle keep-alive connections in the pool"
+    )
+    keepalive_expiry: float = Field(
+        85.0, gt=0, description="Seconds an idle keep-alive connection is kept open"
+    )
+    max_concurrency: int = Field(10, gt=0, description="Maximum in-flight API requests")
 
     @field_validator("api_key")
     @classmethod
@@ -23,11 +42,11 @@ class APIConfiguration(BaseModel):
     @field_validator("base_url")
     @classmethod
     def validate_base_url(cls, v: str) -> str:
-        """Ensure base URL is HTTPS."""
-        if not v.startswith("https://"):
-            raise ValueError("API base URL must use HTTPS")
+        """Ensure base URL is HTTPS with a host."""
+        if not _HTTPS_URL_RE.match(v):
+            raise ValueError("API base URL must use HTTPS and include a host")
         # Remove trailing slash for consistency
-        return v.rstrip("/")
+        return v.removesuffix("/")
 
     @field_validator("timeout")
     @classmethod
@@ -61,21 +80,64 @@ class ServerConfig(BaseSettings):
     workflowy_timeout: int = Field(
         30, description="API request timeout in seconds", alias="WORKFLOWY_TIMEOUT"
     )
+    workflowy_connect_timeout: float = Field(
+        5.0,
+        description="Seconds allowed to establish a connection",
+        alias="WORKFLOWY_CONNECT_TIMEOUT",
+    )
     workflowy_max_retries: int = Field(
         3, description="Maximum retry attempts", alias="WORKFLOWY_MAX_RETRIES"
     )
+    workflowy_http2: bool = Field(
+        True, description="Negotiate HTTP/2 with the API host", alias="WORKFLOWY_HTTP2"
+    )
+    workflowy_max_connections: int = Field(
+        100, description="Maximum open connections in the pool", alias="WORKFLOWY_MAX_CONNECTIONS"
+    )
+    workflowy_max_keepalive_connections: int = Field(
+        20,
+        description="Maximum idle keep-alive connections in the pool",
+        alias="WORKFLOWY_MAX_KEEPALIVE_CONNECTIONS",
+    )
+    workflowy_keepalive_expiry: float = Field(
+        85.0,
+        description="Seconds an idle keep-alive connection is kept open",
+        alias="WORKFLOWY_KEEPALIVE_EXPIRY",
+    )
+    workflowy_max_concurrency: int = Field(
+        10, description="Maximum in-flight API requests", alias="WORKFLOWY_MAX_CONCURRENCY"
+    )
 
     # Server settings
     debug: bool = Field(False, description="Enable debug mode", alias="DEBUG")
     log_level: str = Field("INFO", description="Logging level", alias="LOG_LEVEL")
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "case_sensitive": False}
+    model_config = SettingsConfigDict(
+        env_file=".env", env_file_encoding="utf-8", case_sensitive=False, frozen=True
+    )
+
+    _api_config: APIConfiguration | None = PrivateAttr(None)
 
     def get_api_config(self) -> APIConfiguration:
-        """Convert to APIConfiguration for the API client."""
+        """Convert to APIConfiguration for the API client.
+
+        The settings are frozen, so the result is built once and reused.
+        """
+        if self._api_config is None:
+            self._api_config = self._build_api_config()
+        return self._api_config
+
+    def _build_api_config(self) -> APIConfiguration:
+        """Build the API client configuration from the server settings."""
         return APIConfiguration(
             api_key=self.workflowy_api_key,
             base_url=self.workflowy_api_url,
             timeout=self.workflowy_timeout,
+            connect_timeout=self.workflowy_connect_timeout,
             max_retries=self.workflowy_max_retries,
+            http2=self.workflowy_http2,
+            max_connections=self.workflowy_max_connections,
+            max_keepalive_connections=self.workflowy_max_keepalive_connections,
+            keepalive_expiry=self.workflowy_keepalive_expiry,
+            max_concurrency=self.workflowy_max_concurrency,
         )
@@ -1,6 +1,6 @@
 """Error response models and exception classes."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, Field
 
@@ -35,6 +35,14 @@ class APIError(Exception):
 class WorkFlowyError(Exception):
     """Base exception for WorkFlowy MCP errors."""
 
+    # Lowercased class name reported as the ``error`` key of error responses
+    error_type: ClassVar[str] = "workflowyerror"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compute the error type once per subclass."""
+        super().__init_subclass__(**kwargs)
+        cls.error_type = cls.__name__.lower()
+
     def __init__(
         self, message: str, code: str = "WORKFLOWY_ERROR", details: dict[str, Any] | None = None
     ):
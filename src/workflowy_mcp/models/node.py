@@ -1,15 +1,70 @@
 """WorkFlowy node data model."""
 
-from typing import Any
-
-from pydantic import AliasChoices, BaseModel, Field, field_validator
+from typing import Annotated, Any
+
+from pydantic import (
+    AliasChoices,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+    computed_field,
+    field_validator,
+)
+
+# A string with at least one non-whitespace character, checked by pydantic-core;
+# the value is kept as given rather than stripped
+NonBlankStr = Annotated[str, StringConstraints(pattern=r"\S")]
+
+# Every key the API may use for a field -> the field name
+_ALIAS_MAP: dict[str, str] = {
+    "id": "id",
+    "name": "name",
+    "nm": "name",
+    "note": "note",
+    "no": "note",
+    "priority": "priority",
+    "data": "data",
+    "createdAt": "createdAt",
+    "created": "createdAt",
+    "modifiedAt": "modifiedAt",
+    "modified": "modifiedAt",
+    "completedAt": "completedAt",
+    "children": "children",
+    "ch": "children",
+    "parent_id": "parent_id",
+    "parentId": "parent_id",
+    "completed_flag": "completed_flag",
+    "cp": "completed_flag",
+}
 
 
 class WorkFlowyNode(BaseModel):
     """Represents a single node in the WorkFlowy outline hierarchy."""
 
+    # Nodes are immutable so cached responses can be shared between callers
+    model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        populate_by_name=True,  # Allow both field names and aliases
+        json_schema_extra={
+            "example": {
+                "id": "node-123",
+                "name": "Example Node",
+                "note": "This is a note",
+                "priority": 1,
+                "layoutMode": "bullets",
+                "createdAt": 1704067200,
+                "modifiedAt": 1704067200,
+                "completedAt": None,
+                "children": [],
+            }
+        },
+    )
+
     # API fields (what the API actually returns)
-    id: str = Field(..., description="Unique identifier for the node")
+    id: NonBlankStr = Field(..., description="Unique identifier for the node")
     name: str | None = Field(
         None, validation_alias=AliasChoices("name", "nm"), description="Text content of the node"
     )
@@ -38,9 +93,10 @@ class WorkFlowyNode(BaseModel):
     children: list["WorkFlowyNode"] | None = Field(None, alias="ch", description="Child nodes")
     parent_id: str | None = Field(None, alias="parentId", description="Parent node ID")
 
-    # Handle 'cp' field for backward compatibility - we'll compute from completedAt
+    # Handle 'cp' field for backward compatibility - we'll compute from completedAt.
+    # Input only: the computed ``cp`` below is the one serialized
     completed_flag: bool | None = Field(
-        None, alias="cp", description="Completion status (for tests)"
+        None, validation_alias="cp", exclude=True, description="Completion status (for tests)"
     )
 
     @property
@@ -50,17 +106,22 @@ class WorkFlowyNode(BaseModel):
             return self.data.get("layoutMode")
         return None
 
-    # Backward compatibility aliases for tests
+    # Backward compatibility aliases, serialized alongside the fields. ``ch``
+    # stays a plain property: dumping it next to ``children`` would serialize
+    # every subtree twice per level.
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def nm(self) -> str | None:
         """Backward compatibility for name field."""
         return self.name
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def no(self) -> str | None:
         """Backward compatibility for note field."""
         return self.note
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def cp(self) -> bool:
         """Backward compatibility for completed status."""
@@ -74,23 +135,48 @@ class WorkFlowyNode(BaseModel):
         """Backward compatibility for children field."""
         return self.children
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def created(self) -> int:
         """Backward compatibility for created timestamp."""
         return self.createdAt or 0
 
+    @computed_field  # type: ignore[prop-decorator]
     @property
     def modified(self) -> int:
         """Backward compatibility for modified timestamp."""
         return self.modifiedAt or 0
 
-    @field_validator("id")
     @classmethod
-    def validate_id(cls, v: str) -> str:
-        """Ensure ID is non-empty."""
-        if not v or not v.strip():
-            raise ValueError("Node ID must be non-empty")
-        return v
+    def from_api(cls, data: dict[str, Any]) -> "WorkFlowyNode":
+        """Build a node tree from a trusted API payload without validation.
+
+        Skips field validators and alias resolution for the node and all of
+        its children; use the regular constructor for untrusted input. Nodes
+        without an ``id`` are still validated and rejected.
+        """
+        # Walk the tree with an explicit stack so deep outlines don't recurse.
+        # Each entry is a raw node plus the list and index its model goes to;
+        # child lists are created up front and filled in as entries are popped.
+        root: list[Any] = [None]
+        stack: list[tuple[dict[str, Any], list[Any], int]] = [(data, root, 0)]
+        while stack:
+            raw, target, index = stack.pop()
+            if not isinstance(raw, dict) or not raw.get("id"):
+                # The one required field is missing: validate this subtree so the
+                # payload fails here with a ValidationError, as the constructor would
+                target[index] = cls.model_validate(raw)
+                continue
+            fields = {_ALIAS_MAP[key]: value for key, value in raw.items() if key in _ALIAS_MAP}
+            raw_children = fields.get("children")
+            if raw_children:
+                children: list[Any] = [None] * len(raw_children)
+                fields["children"] = children
+                stack.extend(
+                    (child, children, position) for position, child in enumerate(raw_children)
+                )
+            target[index] = cls.model_construct(**fields)
+        return root[0]  # type: ignore[no-any-return]
 
     @field_validator("createdAt", "modifiedAt", "completedAt")
     @classmethod
@@ -100,38 +186,21 @@ class WorkFlowyNode(BaseModel):
             raise ValueError("Timestamp must be positive")
         return v
 
-    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
-        """Custom serialization to include backward compatibility fields."""
-        data: dict[str, Any] = super().model_dump(**kwargs)
 
-        # Add backward compatibility fields for tests
-        data["nm"] = self.name
-        data["no"] = self.note
-        data["cp"] = self.cp
-        data["ch"] = self.children
-        data["created"] = self.createdAt or 0
-        data["modified"] = self.modifiedAt or 0
+# Enable forward references for recursive model
+WorkFlowyNode.model_rebuild()
 
-        return data
+# Validator for untrusted node data and batch serializer, compiled once at import
+_NODE_ADAPTER: TypeAdapter[WorkFlowyNode] = TypeAdapter(WorkFlowyNode)
+_NODE_LIST_ADAPTER: TypeAdapter[list[WorkFlowyNode]] = TypeAdapter(list[WorkFlowyNode])
 
-    class Config:
-        """Pydantic model configuration."""
 
-        populate_by_name = True  # Allow both field names and aliases
-        json_schema_extra = {
-            "example": {
-                "id": "node-123",
-                "name": "Example Node",
-                "note": "This is a note",
-                "priority": 1,
-                "layoutMode": "bullets",
-                "createdAt": 1704067200,
-                "modifiedAt": 1704067200,
-                "completedAt": None,
-                "children": [],
-            }
-        }
+def parse_node(data: dict[str, Any]) -> WorkFlowyNode:
+    """Validate a node payload, running field validators and aliases."""
+    return _NODE_ADAPTER.validate_python(data)
 
 
-# Enable forward references for recursive model
-WorkFlowyNode.model_rebuild()
+def dump_nodes(nodes: list[WorkFlowyNode]) -> list[dict[str, Any]]:
+    """Serialize a list of nodes to dicts in one pass, like ``model_dump()`` on each."""
+    dumped: list[dict[str, Any]] = _NODE_LIST_ADAPTER.dump_python(nodes)
+    return dumped
@@ -1,59 +1,91 @@
 """Request and response models for WorkFlowy operations."""
 
-from typing import Literal
+from functools import lru_cache
+from typing import ClassVar, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
-from .node import WorkFlowyNode
+from .node import NonBlankStr, WorkFlowyNode
 
+# Values accepted by the API, shared with the tool signatures in the server
+LayoutMode = Literal["bullets", "todo", "h1", "h2", "h3"]
+Position = Literal["top", "bottom"]
 
-class NodeCreateRequest(BaseModel):
+
+class _WireRequest(BaseModel):
+    """Base for request payloads sent as JSON bodies."""
+
+    # Requests are never changed after construction
+    model_config = ConfigDict(frozen=True)
+
+    def to_wire(self) -> bytes:
+        """Serialize the set (non-None) fields straight to JSON bytes."""
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True)
+
+
+class NodeCreateRequest(_WireRequest):
     """Request payload for creating a new node."""
 
     parent_id: str | None = Field(None, description="Parent node ID ('None' for root level)")
-    name: str = Field(..., description="Text content (required)")
+    name: NonBlankStr = Field(..., description="Text content (required)")
     note: str | None = Field(None, description="Note content (optional)")
-    layoutMode: Literal["bullets", "todo", "h1", "h2", "h3"] | None = Field(
+    layoutMode: LayoutMode | None = Field(
         None, description="Display mode (bullets, todo, h1, h2, h3)"
     )
-    position: Literal["top", "bottom"] | None = Field(
+    position: Position | None = Field(
         "top", description="Position: 'top' or 'bottom' (default: 'top')"
     )
 
-    @field_validator("name")
-    @classmethod
-    def validate_name(cls, v: str) -> str:
-        """Ensure name is non-empty."""
-        if not v or not v.strip():
-            raise ValueError("Node name must be non-empty")
-        return v
-
-    @field_validator("parent_id")
-    @classmethod
-    def validate_parent_id(cls, v: str | None) -> str | None:
-        """Keep parent_id as-is - None means root level."""
-        return v
 
-
-class NodeUpdateRequest(BaseModel):
+class NodeUpdateRequest(_WireRequest):
     """Request payload for updating an existing node."""
 
     name: str | None = Field(None, description="New text content")
     note: str | None = Field(None, description="New note content")
-    layoutMode: Literal["bullets", "todo", "h1", "h2", "h3"] | None = Field(
+    layoutMode: LayoutMode | None = Field(
         None, description="New display mode (bullets, todo, h1, h2, h3)"
     )
 
+    # Names of the updatable fields, fixed when the class is defined
+    _UPDATE_FIELDS: ClassVar[tuple[str, ...]] = ("name", "note", "layoutMode")
+
     def has_updates(self) -> bool:
         """Check if at least one field is provided for update."""
-        return any(getattr(self, field) is not None for field in self.model_fields)
+        # Read the instance dict rather than a mask stored at construction:
+        # model_copy(update=...) changes fields without re-running any hooks
+        values = self.__dict__
+        return any(values.get(field) is not None for field in self._UPDATE_FIELDS)
 
 
 class NodeListRequest(BaseModel):
     """Request parameters for listing nodes."""
 
+    model_config = ConfigDict(frozen=True)
+
     parentId: str | None = Field(None, description="Parent node ID to list children for")
 
+    @classmethod
+    def empty(cls) -> "NodeListRequest":
+        """Get the shared request for listing root nodes without filters."""
+        return _EMPTY_LIST_REQUEST
+
+    @classmethod
+    def for_parent(cls, parent_id: str | None) -> "NodeListRequest":
+        """Get a shared request for listing the children of ``parent_id``."""
+        if parent_id is None:
+            return _EMPTY_LIST_REQUEST
+        return _list_request_for_parent(parent_id)
+
+
+# Frozen, so one instance can back every unfiltered list call
+_EMPTY_LIST_REQUEST = NodeListRequest()  # type: ignore[call-arg]
+
+
+@lru_cache(maxsize=256)
+def _list_request_for_parent(parent_id: str) -> NodeListRequest:
+    """Build (once per recently used parent) the request listing its children."""
+    return NodeListRequest(parentId=parent_id)
+
 
 class NodeResponse(BaseModel):
     """Response for single node operations."""
@@ -1,19 +1,27 @@
 """WorkFlowy MCP server implementation using FastMCP."""
 
 import logging
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Literal
 
 from fastmcp import FastMCP
 
-from .client import AdaptiveRateLimiter, WorkFlowyClient
-from .config import ServerConfig, setup_logging
+from .client import (
+    AdaptiveRateLimiter,
+    WorkFlowyClient,
+    close_shared_client,
+    get_shared_client,
+)
+from .config import ServerConfig, setup_event_loop, setup_logging
 from .models import (
     NodeCreateRequest,
     NodeListRequest,
     NodeUpdateRequest,
+    RateLimitError,
     WorkFlowyNode,
 )
+from .models.node import dump_nodes
+from .models.requests import LayoutMode, Position
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +30,29 @@ _client: WorkFlowyClient | None = None
 _rate_limiter: AdaptiveRateLimiter | None = None
 
 
+@asynccontextmanager
+async def _rate_limited() -> AsyncIterator[None]:
+    """Pace an API call through the global rate limiter and feed back its outcome."""
+    rate_limiter = _rate_limiter
+    if rate_limiter is None:
+        yield
+        return
+
+    await rate_limiter.acquire()
+    try:
+        yield
+    except RateLimitError as e:
+        rate_limiter.on_rate_limit(e.details.get("retry_after"))
+        raise
+    rate_limiter.on_success()
+
+
 def get_client() -> WorkFlowyClient:
     """Get the global WorkFlowy client instance."""
-    global _client
-    if _client is None:
+    client = _client
+    if client is None:
         raise RuntimeError("WorkFlowy client not initialized. Server not started properly.")
-    return _client
+    return client
 
 
 @asynccontextmanager
@@ -49,8 +74,8 @@ async def lifespan(_app: FastMCP):  # type: ignore[no-untyped-def]
         max_rate=100.0,
     )
 
-    # Initialize client
-    _client = WorkFlowyClient(api_config)
+    # Initialize client (shared so every tool reuses one connection pool)
+    _client = get_shared_client(api_config)
 
     logger.info(f"WorkFlowy client initialized with base URL: {api_config.base_url}")
 
@@ -58,9 +83,8 @@ async def lifespan(_app: FastMCP):  # type: ignore[no-untyped-def]
 
     # Cleanup
     logger.info("Shutting down WorkFlowy MCP server")
-    if _client:
-        await _client.close()
-        _client = None
+    await close_shared_client()
+    _client = None
     _rate_limiter = None
 
 
@@ -79,8 +103,8 @@ async def create_node(
     name: str,
     parent_id: str | None = None,
     note: str | None = None,
-    layout_mode: Literal["bullets", "todo", "h1", "h2", "h3"] | None = None,
-    position: Literal["top", "bottom"] = "top",
+    layout_mode: LayoutMode | None = None,
+    position: Position = "top",
     _completed: bool = False,
 ) -> WorkFlowyNode:
     """Create a new node in WorkFlowy.
@@ -106,18 +130,8 @@ async def create_node(
         position=position,
     )
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
-        node = await client.create_node(request)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return node
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    async with _rate_limited():
+        return await client.create_node(request)
 
 
 # Tool: Update Node
@@ -126,7 +140,7 @@ async def update_node(
     node_id: str,
     name: str | None = None,
     note: str | None = None,
-    layout_mode: Literal["bullets", "todo", "h1", "h2", "h3"] | None = None,
+    layout_mode: LayoutMode | None = None,
     _completed: bool | None = None,
 ) -> WorkFlowyNode:
     """Update an existing WorkFlowy node.
@@ -149,18 +163,8 @@ async def update_node(
         layoutMode=layout_mode,
     )
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
-        node = await client.update_node(node_id, request)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return node
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    async with _rate_limited():
+        return await client.update_node(node_id, request)
 
 
 # Tool: Get Node
@@ -176,18 +180,8 @@ async def get_node(node_id: str) -> WorkFlowyNode:
     """
     client = get_client()
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
-        node = await client.get_node(node_id)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return node
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    async with _rate_limited():
+        return await client.get_node(node_id)
 
 
 # Tool: List Nodes
@@ -206,25 +200,14 @@ async def list_nodes(
     """
     client = get_client()
 
-    request = NodeListRequest(  # type: ignore[call-arg]
-        parentId=parent_id,
-    )
-
-    if _rate_limiter:
-        await _rate_limiter.acquire()
+    request = NodeListRequest.for_parent(parent_id)
 
-    try:
+    async with _rate_limited():
         nodes, total = await client.list_nodes(request)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return {
-            "nodes": [node.model_dump() for node in nodes],
-            "total": total,
-        }
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    return {
+        "nodes": dump_nodes(nodes),
+        "total": total,
+    }
 
 
 # Tool: Delete Node
@@ -240,18 +223,9 @@ async def delete_node(node_id: str) -> dict:
     """
     client = get_client()
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
+    async with _rate_limited():
         success = await client.delete_node(node_id)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return {"success": success, "deleted_id": node_id}
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    return {"success": success, "deleted_id": node_id}
 
 
 # Tool: Complete Node
@@ -267,18 +241,8 @@ async def complete_node(node_id: str) -> WorkFlowyNode:
     """
     client = get_client()
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
-        node = await client.complete_node(node_id)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return node
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    async with _rate_limited():
+        return await client.complete_node(node_id)
 
 
 # Tool: Uncomplete Node
@@ -294,18 +258,29 @@ async def uncomplete_node(node_id: str) -> WorkFlowyNode:
     """
     client = get_client()
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
+    async with _rate_limited():
+        return await client.uncomplete_node(node_id)
 
-    try:
-        node = await client.uncomplete_node(node_id)
-        if _rate_limiter:
-            _rate_limiter.on_success()
-        return node
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+
+def _format_outline(nodes: list[WorkFlowyNode]) -> str:
+    """Render nodes and their children as an indented Markdown list."""
+    indents = ["", "  "]
+    lines: list[str] = []
+    stack = [(node, 0) for node in reversed(nodes)]
+
+    while stack:
+        node, depth = stack.pop()
+        if depth + 1 >= len(indents):
+            indents.append(indents[-1] + "  ")
+
+        status = "[x] " if node.cp else ""
+        lines.append(f"{indents[depth]}- {status}{node.nm or '(untitled)'}")
+        if node.no:
+            lines.append(f"{indents[depth + 1]}Note: {node.no}")
+        if node.ch:
+            stack.extend((child, depth + 1) for child in reversed(node.ch))
+
+    return "\n".join(lines)
 
 
 # Resource: WorkFlowy Outline
@@ -322,43 +297,10 @@ async def get_outline() -> str:
     """
     client = get_client()
 
-    if _rate_limiter:
-        await _rate_limiter.acquire()
-
-    try:
-        # Get root nodes
-        request = NodeListRequest(  # type: ignore[call-arg]
-            limit=1000,  # Get many nodes
-        )
-        nodes, _ = await client.list_nodes(request)
-
-        if _rate_limiter:
-            _rate_limiter.on_success()
-
-        # Format outline
-        def format_node(node: WorkFlowyNode, indent: int = 0) -> str:
-            lines = []
-            prefix = "  " * indent + "- "
-            status = "[x] " if node.cp else ""
-            lines.append(f"{prefix}{status}{node.nm or '(untitled)'}")
-
-            if node.no:
-                note_prefix = "  " * (indent + 1)
-                lines.append(f"{note_prefix}Note: {node.no}")
-
-            if node.ch:
-                for child in node.ch:
-                    lines.append(format_node(child, indent + 1))
-
-            return "\n".join(lines)
-
-        outline_parts = [format_node(node) for node in nodes]
-        return "\n".join(outline_parts)
-
-    except Exception as e:
-        if _rate_limiter and hasattr(e, "__class__") and e.__class__.__name__ == "RateLimitError":
-            _rate_limiter.on_rate_limit(getattr(e, "retry_after", None))
-        raise
+    # Get root nodes
+    async with _rate_limited():
+        nodes, _ = await client.list_nodes(NodeListRequest.empty())
+    return _format_outline(nodes)
 
 
 if __name__ == "__main__":
@@ -366,5 +308,5 @@ if __name__ == "__main__":
     setup_logging()
 
     # Run the server
-
+    setup_event_loop()
     mcp.run(transport="stdio")
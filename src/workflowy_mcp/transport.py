@@ -1,16 +1,24 @@
 """STDIO transport handler for WorkFlowy MCP Server."""
 
 import asyncio
+import codecs
 import json
 import logging
+import re
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_READ_CHUNK_SIZE = 65536
+_JSON_DECODER = json.JSONDecoder()
+_NON_SPACE = re.compile(r"\S")
+
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a JSON-RPC message."""
 
@@ -22,6 +30,51 @@ class Message:
     error: dict[str, Any] | None = None
 
 
+_MESSAGE_FIELDS = tuple(field.name for field in fields(Message))
+
+
+class _StdoutProtocol(asyncio.BaseProtocol):
+    """Write-only pipe protocol that tracks flow control for stdout."""
+
+    def __init__(self) -> None:
+        self.paused = False
+        self._waiters: list[asyncio.Future[None]] = []
+        self._closed = False
+
+    def pause_writing(self) -> None:
+        self.paused = True
+
+    def resume_writing(self) -> None:
+        self.paused = False
+        self._wake()
+
+    def connection_lost(self, _exc: Exception | None) -> None:
+        self.paused = False
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+        self._waiters.clear()
+
+    async def _wait(self) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        await waiter
+
+    async def drain(self) -> None:
+        """Wait until the pipe accepts more data; returns at once unless paused."""
+        if self.paused:
+            await self._wait()
+
+    async def wait_closed(self) -> None:
+        """Wait until the pipe has been flushed and closed."""
+        if not self._closed:
+            await self._wait()
+
+
 class STDIOTransport:
     """
     STDIO transport implementation for MCP.
@@ -32,9 +85,18 @@ class STDIOTransport:
     def __init__(self) -> None:
         """Initialize STDIO transport."""
         self.reader: asyncio.StreamReader | None = None
-        self.writer: asyncio.StreamWriter | None = None
+        self.writer: asyncio.WriteTransport | None = None
+        self._stdout: _StdoutProtocol | None = None
         self.running = False
         self.message_id = 0
+        # Decoded stdin text and the offset of its first unconsumed character
+        self._buffer = ""
+        self._start = 0
+        # Decoded reads that have not completed a line yet
+        self._partial: list[str] = []
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        # Encoded messages waiting for the next flush to stdout
+        self._pending: list[bytes] = []
 
     async def start(self) -> None:
         """Start the STDIO transport."""
@@ -47,18 +109,16 @@ class STDIOTransport:
         protocol = asyncio.StreamReaderProtocol(self.reader)
         await loop.connect_read_pipe(lambda: protocol, sys.stdin)
 
-        w_transport, w_protocol = await loop.connect_write_pipe(
-            asyncio.streams.FlowControlMixin, sys.stdout
-        )
-        self.writer = asyncio.StreamWriter(w_transport, w_protocol, self.reader, loop)
+        self.writer, self._stdout = await loop.connect_write_pipe(_StdoutProtocol, sys.stdout)
 
     async def stop(self) -> None:
         """Stop the STDIO transport."""
         logger.info("Stopping STDIO transport")
         self.running = False
-        if self.writer:
+        self._flush()
+        if self.writer and self._stdout:
             self.writer.close()
-            await self.writer.wait_closed()
+            await self._stdout.wait_closed()
 
     async def read_message(self) -> Message | None:
         """
@@ -71,43 +131,24 @@ class STDIOTransport:
             return None
 
         try:
-            # Read until we get a complete JSON object
-            buffer = ""
-            depth = 0
-            in_string = False
-            escape_next = False
-
             while self.running:
-                char_bytes = await self.reader.read(1)
-                if not char_bytes:
-                    break
-
-                char = char_bytes.decode("utf-8")
-                buffer += char
-
-                # Track JSON structure
-                if not escape_next:
-                    if char == '"' and not in_string:
-                        in_string = True
-                    elif char == '"' and in_string:
-                        in_string = False
-                    elif char == "\\" and in_string:
-                        escape_next = True
-                        continue
-                    elif char == "{" and not in_string:
-                        depth += 1
-                    elif char == "}" and not in_string:
-                        depth -= 1
-                        if depth == 0 and buffer.strip():
-                            # Complete JSON object
-                            try:
-                                data = json.loads(buffer)
-                                return Message(**data)
-                            except json.JSONDecodeError as e:
-                                logger.error(f"Failed to parse message: {e}")
-                                buffer = ""
-                else:
-                    escape_next = False
+                message = self._next_message()
+                if message is not None:
+                    return message
+
+                # Only a read that completes a line can complete a message, so
+                # until one arrives reads are collected without being parsed
+                while True:
+                    chunk = await self.reader.read(_READ_CHUNK_SIZE)
+                    if not chunk:
+                        # The last message may end without a newline
+                        self._join_partial()
+                        return self._next_message(at_eof=True)
+                    text = self._decoder.decode(chunk)
+                    self._partial.append(text)
+                    if "\n" in text:
+                        break
+                self._join_partial()
 
         except asyncio.CancelledError:
             logger.info("Read cancelled")
@@ -116,6 +157,62 @@ class STDIOTransport:
 
         return None
 
+    def _join_partial(self) -> None:
+        """Append collected reads to the buffer, dropping consumed text."""
+        self._buffer = self._buffer[self._start :] + "".join(self._partial)
+        self._start = 0
+        self._partial.clear()
+
+    def _next_message(self, at_eof: bool = False) -> Message | None:
+        """
+        Pop the first complete JSON object off the read buffer.
+
+        Args:
+            at_eof: Whether stdin is exhausted, so a trailing unterminated
+                line may hold the last message
+
+        Returns:
+            Parsed message, or None if the buffer holds no complete object yet
+        """
+        buffer = self._buffer
+        while True:
+            match = _NON_SPACE.search(buffer, self._start)
+            if match is None:
+                self._buffer = ""
+                self._start = 0
+                return None
+            start = match.start()
+
+            # Fast path: MCP stdio sends one message per line
+            newline = buffer.find("\n", start)
+            if newline != -1:
+                try:
+                    data = orjson.loads(buffer[start:newline])
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    self._start = newline + 1
+                    return Message(**data)
+            elif not at_eof:
+                self._start = start
+                return None
+
+            try:
+                data, end = _JSON_DECODER.raw_decode(buffer, start)
+            except json.JSONDecodeError as e:
+                # A valid prefix only fails on its last, unfinished token, which
+                # never spans a newline; a newline past the error means bad input.
+                newline = buffer.find("\n", e.pos)
+                if newline == -1:
+                    self._start = start
+                    return None
+                logger.error(f"Failed to parse message: {e}")
+                self._start = newline + 1
+                continue
+
+            self._start = end
+            return Message(**data)
+
     async def write_message(self, message: Message) -> None:
         """
         Write a message to stdout.
@@ -123,31 +220,34 @@ class STDIOTransport:
         Args:
             message: Message to send
         """
-        if not self.running or not self.writer:
+        if not self.running or not self.writer or not self._stdout or self.writer.is_closing():
             return
 
         try:
-            # Convert message to dict
-            data: dict[str, Any] = {
-                "jsonrpc": message.jsonrpc,
+            data = {
+                name: value
+                for name in _MESSAGE_FIELDS
+                if (value := getattr(message, name)) is not None
             }
 
-            if message.id is not None:
-                data["id"] = message.id
-            if message.method is not None:
-                data["method"] = message.method
-            if message.params is not None:
-                data["params"] = message.params
-            if message.result is not None:
-                data["result"] = message.result
-            if message.error is not None:
-                data["error"] = message.error
-
-            # Write as JSON with newline
-            json_str = json.dumps(data) + "\n"
-            self.writer.write(json_str.encode("utf-8"))
-            await self.writer.drain()
+            # Queue as JSON with newline; messages written in the same loop
+            # iteration go out together, and we only wait when stdout pushes back
+            self._pending.append(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+            if len(self._pending) == 1:
+                asyncio.get_running_loop().call_soon(self._flush)
+            if self._stdout.paused:
+                await self._stdout.drain()
+
+        except Exception as e:
+            logger.error(f"Error writing message: {e}")
 
+    def _flush(self) -> None:
+        """Hand every queued message to the stdout transport in one write."""
+        pending, self._pending = self._pending, []
+        if not pending or not self.writer or self.writer.is_closing():
+            return
+        try:
+            self.writer.writelines(pending)
         except Exception as e:
             logger.error(f"Error writing message: {e}")
 
@@ -3,14 +3,16 @@
 import asyncio
 import os
 import sys
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 from pathlib import Path
+from types import MappingProxyType, ModuleType
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
 from fastmcp import FastMCP
+from fastmcp.tools import Tool
 
 # Add src to path for imports
 src_path = Path(__file__).parent.parent / "src"
@@ -21,22 +23,88 @@ os.environ.setdefault("WORKFLOWY_API_KEY", "test-api-key")
 os.environ.setdefault("WORKFLOWY_API_URL", "https://api.test.workflowy.com")
 os.environ.setdefault("LOG_LEVEL", "ERROR")
 
+# Sample payloads are built once; each fixture hands out a fresh copy. The
+# values are flat scalars, so a shallow copy keeps tests isolated.
+_SAMPLE_NODE_DATA = MappingProxyType(
+    {
+        "id": "node-123",
+        "nm": "Sample Node",
+        "no": "This is a note",
+        "cp": False,
+        "created": 1704067200,
+        "modified": 1704067200,
+        "priority": 1,
+    }
+)
+
+_SAMPLE_CREATE_REQUEST = MappingProxyType(
+    {
+        "name": "New Test Node",
+        "note": "Test note content",
+        "parentId": None,
+        "priority": 2,
+    }
+)
+
+_SAMPLE_UPDATE_REQUEST = MappingProxyType(
+    {
+        "id": "node-123",
+        "name": "Updated Node Name",
+        "note": "Updated note content",
+        "priority": 3,
+    }
+)
+
+_SAMPLE_LIST_REQUEST = MappingProxyType(
+    {
+        "parentId": None,
+        "completed": False,
+        "query": "test",
+        "limit": 100,
+        "offset": 0,
+    }
+)
+
+
+MCP_TOOLS_KEY = pytest.StashKey[dict[str, Tool]]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Build the server's tool registry once, before any test runs."""
+    from workflowy_mcp.server import mcp
+
+    config.stash[MCP_TOOLS_KEY] = asyncio.run(mcp.get_tools())
+
 
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def adapters() -> ModuleType:
+    """The contract-test tool adapters, imported once for the session."""
+    from . import tool_adapters
 
+    return tool_adapters
 
-@pytest_asyncio.fixture
+
+@pytest_asyncio.fixture(scope="session")
 async def mock_mcp_server() -> AsyncGenerator[FastMCP, None]:
     """Create a mock MCP server for testing."""
     server = FastMCP("workflowy-test")
     yield server
 
 
+@pytest.fixture(scope="session")
+def server_module() -> ModuleType:
+    """The server module, imported once for the session."""
+    import workflowy_mcp.server as server
+
+    return server
+
+
+@pytest.fixture
+def mcp_tools(request: pytest.FixtureRequest) -> dict[str, Tool]:
+    """Tools registered on the real server, introspected once at startup."""
+    return request.config.stash[MCP_TOOLS_KEY]
+
+
 @pytest.fixture
 def mock_api_client() -> AsyncMock:
     """Create a mock WorkFlowy API client."""
@@ -49,49 +117,25 @@ def mock_api_client() -> AsyncMock:
 @pytest.fixture
 def sample_node_data() -> dict[str, Any]:
     """Provide sample WorkFlowy node data."""
-    return {
-        "id": "node-123",
-        "nm": "Sample Node",
-        "no": "This is a note",
-        "cp": False,
-        "created": 1704067200,
-        "modified": 1704067200,
-        "priority": 1,
-    }
+    return dict(_SAMPLE_NODE_DATA)
 
 
 @pytest.fixture
 def sample_create_request() -> dict[str, Any]:
     """Provide sample create node request data."""
-    return {
-        "name": "New Test Node",
-        "note": "Test note content",
-        "parentId": None,
-        "priority": 2,
-    }
+    return dict(_SAMPLE_CREATE_REQUEST)
 
 
 @pytest.fixture
 def sample_update_request() -> dict[str, Any]:
     """Provide sample update node request data."""
-    return {
-        "id": "node-123",
-        "name": "Updated Node Name",
-        "note": "Updated note content",
-        "priority": 3,
-    }
+    return dict(_SAMPLE_UPDATE_REQUEST)
 
 
 @pytest.fixture
 def sample_list_request() -> dict[str, Any]:
     """Provide sample list nodes request data."""
-    return {
-        "parentId": None,
-        "completed": False,
-        "query": "test",
-        "limit": 100,
-        "offset": 0,
-    }
+    return dict(_SAMPLE_LIST_REQUEST)
 
 
 @pytest.fixture
@@ -102,20 +146,43 @@ def mock_tool_context() -> MagicMock:
     return context
 
 
-@pytest.fixture(autouse=True)
-def mock_global_client():
-    """Mock the global WorkFlowy client for integration tests."""
-    from unittest.mock import patch
+class FakeWorkFlowyClient:
+    """Stand-in client exposing only the coroutines the server tools call."""
 
-    import workflowy_mcp.server as server
-    from workflowy_mcp.client import WorkFlowyClient
+    METHODS = (
+        "create_node",
+        "update_node",
+        "get_node",
+        "list_nodes",
+        "delete_node",
+        "complete_node",
+        "uncomplete_node",
+    )
 
-    # Create a mock client
-    mock_client = AsyncMock(spec=WorkFlowyClient)
+    def __init__(self) -> None:
+        for name in self.METHODS:
+            setattr(self, name, AsyncMock())
 
-    # Patch the global _client variable
-    with (
-        patch.object(server, "_client", mock_client),
-        patch.object(server, "get_client", return_value=mock_client),
-    ):
+    def reset_mock(self) -> None:
+        """Clear calls, return values and side effects on every method."""
+        for name in self.METHODS:
+            getattr(self, name).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def _patched_client(server_module: ModuleType) -> Iterator[FakeWorkFlowyClient]:
+    """Patch the server's global client once for the whole session."""
+    from unittest.mock import patch
+
+    mock_client = FakeWorkFlowyClient()
+
+    # Patch the global _client variable; get_client() reads it, so it needs no patch
+    with patch.object(server_module, "_client", mock_client):
         yield mock_client
+
+
+@pytest.fixture(autouse=True)
+def mock_global_client(_patched_client: FakeWorkFlowyClient) -> FakeWorkFlowyClient:
+    """Mock the global WorkFlowy client, with responses cleared for each test."""
+    _patched_client.reset_mock()
+    return _patched_client
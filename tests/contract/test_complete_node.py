@@ -1,25 +1,21 @@
 """Contract tests for the workflowy_complete_node MCP tool."""
 
+from types import ModuleType
+
 import pytest
-from fastmcp import FastMCP
+from fastmcp.tools import Tool
+
+pytestmark = pytest.mark.contract
 
 
 class TestCompleteNodeContract:
     """Contract tests for node completion tool."""
 
-    @pytest.mark.asyncio
-    async def test_complete_node_input_schema(
-        self, mock_mcp_server: FastMCP  # noqa: ARG002
-    ) -> None:
+    def test_complete_node_input_schema(self, mcp_tools: dict[str, Tool]) -> None:
         """Test that complete_node accepts the correct input schema."""
-        from workflowy_mcp.server import mcp
-
-        # Get tools from the actual server
-        tools = await mcp.get_tools()
-
         # Find the tool
-        assert "workflowy_complete_node" in tools
-        tool = tools["workflowy_complete_node"]
+        assert "workflowy_complete_node" in mcp_tools
+        tool = mcp_tools["workflowy_complete_node"]
 
         assert tool.name == "workflowy_complete_node"
         assert tool.description is not None
@@ -30,11 +26,8 @@ class TestCompleteNodeContract:
         assert "node_id" in params["properties"]
         assert params["required"] == ["node_id"]
 
-    @pytest.mark.asyncio
-    async def test_complete_node_basic(self) -> None:
+    async def test_complete_node_basic(self, adapters: ModuleType) -> None:
         """Test basic complete_node operation."""
-        from ..tool_adapters import test_complete_node
-
         # This will use mocked client
-        result = await test_complete_node({"id": "test-id"})
+        result = await adapters.test_complete_node({"id": "test-id"})
         assert result is not None
@@ -1,23 +1,21 @@
 """Contract tests for the workflowy_delete_node MCP tool."""
 
+from types import ModuleType
+
 import pytest
-from fastmcp import FastMCP
+from fastmcp.tools import Tool
+
+pytestmark = pytest.mark.contract
 
 
 class TestDeleteNodeContract:
     """Contract tests for node deletion tool."""
 
-    @pytest.mark.asyncio
-    async def test_delete_node_input_schema(self, mock_mcp_server: FastMCP) -> None:  # noqa: ARG002
+    def test_delete_node_input_schema(self, mcp_tools: dict[str, Tool]) -> None:
         """Test that delete_node accepts the correct input schema."""
-        from workflowy_mcp.server import mcp
-
-        # Get tools from the actual server
-        tools = await mcp.get_tools()
-
         # Find the tool
-        assert "workflowy_delete_node" in tools
-        tool = tools["workflowy_delete_node"]
+        assert "workflowy_delete_node" in mcp_tools
+        tool = mcp_tools["workflowy_delete_node"]
 
         assert tool.name == "workflowy_delete_node"
         assert tool.description is not None
@@ -28,11 +26,8 @@ class TestDeleteNodeContract:
         assert "node_id" in params["properties"]
         assert params["required"] == ["node_id"]
 
-    @pytest.mark.asyncio
-    async def test_delete_node_basic(self) -> None:
+    async def test_delete_node_basic(self, adapters: ModuleType) -> None:
         """Test basic delete_node operation."""
-        from ..tool_adapters import test_delete_node
-
         # This will use mocked client
-        result = await test_delete_node({"id": "test-id"})
+        result = await adapters.test_delete_node({"id": "test-id"})
         assert result is not None
@@ -1,25 +1,21 @@
 """Contract tests for the workflowy_uncomplete_node MCP tool."""
 
+from types import ModuleType
+
 import pytest
-from fastmcp import FastMCP
+from fastmcp.tools import Tool
+
+pytestmark = pytest.mark.contract
 
 
 class TestUncompleteNodeContract:
     """Contract tests for node uncompletion tool."""
 
-    @pytest.mark.asyncio
-    async def test_uncomplete_node_input_schema(
-        self, mock_mcp_server: FastMCP  # noqa: ARG002
-    ) -> None:
+    def test_uncomplete_node_input_schema(self, mcp_tools: dict[str, Tool]) -> None:
         """Test that uncomplete_node accepts the correct input schema."""
-        from workflowy_mcp.server import mcp
-
-        # Get tools from the actual server
-        tools = await mcp.get_tools()
-
         # Find the tool
-        assert "workflowy_uncomplete_node" in tools
-        tool = tools["workflowy_uncomplete_node"]
+        assert "workflowy_uncomplete_node" in mcp_tools
+        tool = mcp_tools["workflowy_uncomplete_node"]
 
         assert tool.name == "workflowy_uncomplete_node"
         assert tool.description is not None
@@ -30,11 +26,8 @@ class TestUncompleteNodeContract:
         assert "node_id" in params["properties"]
         assert params["required"] == ["node_id"]
 
-    @pytest.mark.asyncio
-    async def test_uncomplete_node_basic(self) -> None:
+    async def test_uncomplete_node_basic(self, adapters: ModuleType) -> None:
         """Test basic uncomplete_node operation."""
-        from ..tool_adapters import test_uncomplete_node
-
         # This will use mocked client
-        result = await test_uncomplete_node({"id": "test-id"})
+        result = await adapters.test_uncomplete_node({"id": "test-id"})
         assert result is not None
@@ -1,56 +1,55 @@
 """Configuration for integration tests."""
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
-from workflowy_mcp.models import WorkFlowyNode
+from workflowy_mcp.client import WorkFlowyClient
+from workflowy_mcp.models import NodeNotFoundError, WorkFlowyNode
 
 
-@pytest.fixture
-def mock_workflowy_client():
-    """Create a properly configured mock WorkFlowy client for integration tests."""
-    from workflowy_mcp.client import WorkFlowyClient
+class FakeWorkFlowyClient:
+    """Stateful stand-in for WorkFlowyClient used by the integration tests."""
 
-    client = AsyncMock(spec=WorkFlowyClient)
+    def __init__(self) -> None:
+        # Storage for created nodes to simulate stateful behavior
+        # IMPORTANT: These are reset for each test to avoid cross-test contamination
+        self._created_nodes: dict[str, WorkFlowyNode] = {}
+        self._deleted_nodes: set[str] = set()  # Track deleted nodes
+        self._node_counter = 0
+        self._parent_child_map: dict[str, list[str]] = {}  # Track parent-child relationships
 
-    # Storage for created nodes to simulate stateful behavior
-    # IMPORTANT: These are reset for each test to avoid cross-test contamination
-    created_nodes = {}
-    deleted_nodes = set()  # Track deleted nodes
-    node_counter = [0]  # Using list to avoid closure issues
-    parent_child_map = {}  # Track parent-child relationships
+    def reset(self) -> None:
+        """Forget every node created, deleted or linked by a previous test."""
+        self._created_nodes.clear()
+        self._deleted_nodes.clear()
+        self._parent_child_map.clear()
+        self._node_counter = 0
 
-    async def mock_create_node(request):
+    async def create_node(self, request):
         """Mock create_node with unique IDs for each call."""
-        node_counter[0] += 1
-        node_id = f"node-{node_counter[0]:03d}"
+        self._node_counter += 1
+        node_id = f"node-{self._node_counter:03d}"
         node = WorkFlowyNode(
             id=node_id,
-            name=getattr(request, "name", None) or f"Node {node_counter[0]}",
+            name=getattr(request, "name", None) or f"Node {self._node_counter}",
             note=getattr(request, "note", ""),
             completedAt=None,
             createdAt=1704067200,
             modifiedAt=1704067200,
         )
-        created_nodes[node_id] = node
+        self._created_nodes[node_id] = node
 
         # Track parent-child relationship
         if hasattr(request, "parent_id") and request.parent_id:
-            if request.parent_id not in parent_child_map:
-                parent_child_map[request.parent_id] = []
-            parent_child_map[request.parent_id].append(node_id)
+            self._parent_child_map.setdefault(request.parent_id, []).append(node_id)
 
         return node
 
-    async def mock_get_node(node_id):
+    async def get_node(self, node_id):
         """Mock get_node that returns the requested node."""
-        from workflowy_mcp.models import NodeNotFoundError
-
-        if node_id in deleted_nodes:
+        if node_id in self._deleted_nodes:
             raise NodeNotFoundError(f"Node {node_id} not found")
-        if node_id in created_nodes:
-            return created_nodes[node_id]
+        if node_id in self._created_nodes:
+            return self._created_nodes[node_id]
         # Return a default node if not found
         return WorkFlowyNode(
             id=node_id,
@@ -61,14 +60,16 @@ def mock_workflowy_client():
             modifiedAt=1704067200,
         )
 
-    async def mock_update_node(node_id, request):
+    async def update_node(self, node_id, request):
         """Mock update_node that updates the node."""
-        if node_id in created_nodes:
-            node = created_nodes[node_id]
+        if node_id in self._created_nodes:
+            updates = {}
             if hasattr(request, "name") and request.name is not None:
-                node.name = request.name
+                updates["name"] = request.name
             if hasattr(request, "note") and request.note is not None:
-                node.note = request.note
+                updates["note"] = request.note
+            node = self._created_nodes[node_id].model_copy(update=updates)
+            self._created_nodes[node_id] = node
             return node
         # Return updated node even if not in storage
         return WorkFlowyNode(
@@ -80,11 +81,11 @@ def mock_workflowy_client():
             modifiedAt=1704067200,
         )
 
-    async def mock_complete_node(node_id):
+    async def complete_node(self, node_id):
         """Mock complete_node that marks node as completed."""
-        if node_id in created_nodes:
-            node = created_nodes[node_id]
-            node.completedAt = 1704067200
+        if node_id in self._created_nodes:
+            node = self._created_nodes[node_id].model_copy(update={"completedAt": 1704067200})
+            self._created_nodes[node_id] = node
             return node
         return WorkFlowyNode(
             id=node_id,
@@ -95,11 +96,11 @@ def mock_workflowy_client():
             modifiedAt=1704067200,
         )
 
-    async def mock_uncomplete_node(node_id):
+    async def uncomplete_node(self, node_id):
         """Mock uncomplete_node that marks node as uncompleted."""
-        if node_id in created_nodes:
-            node = created_nodes[node_id]
-            node.completedAt = None
+        if node_id in self._created_nodes:
+            node = self._created_nodes[node_id].model_copy(update={"completedAt": None})
+            self._created_nodes[node_id] = node
             return node
         return WorkFlowyNode(
             id=node_id,
@@ -110,64 +111,65 @@ def mock_workflowy_client():
             modifiedAt=1704067200,
         )
 
-    async def mock_list_nodes(request):
+    async def list_nodes(self, request):
         """Mock list_nodes that returns appropriate nodes."""
         # Start with all nodes or empty list
-        if not created_nodes:
+        if not self._created_nodes:
             # Return empty for tests that haven't created anything
             return ([], 0)
 
-        nodes = list(created_nodes.values())
+        nodes = list(self._created_nodes.values())
 
         # Filter by parent_id if provided (request has parentId field)
         if hasattr(request, "parentId") and request.parentId:
             # Only return children of the specified parent
-            child_ids = parent_child_map.get(request.parentId, [])
+            child_ids = self._parent_child_map.get(request.parentId, [])
             nodes = [n for n in nodes if n.id in child_ids]
 
         total = len(nodes)
         return (nodes, total)
 
-    async def mock_delete_node(node_id):
+    async def delete_node(self, node_id):
         """Mock delete_node that marks node as deleted."""
-        deleted_nodes.add(node_id)
-        if node_id in created_nodes:
-            del created_nodes[node_id]
+        self._deleted_nodes.add(node_id)
+        self._created_nodes.pop(node_id, None)
 
         # Clean up parent-child relationships
-        for parent_id in list(parent_child_map.keys()):
-            if node_id in parent_child_map[parent_id]:
-                parent_child_map[parent_id].remove(node_id)
-            if not parent_child_map[parent_id]:
-                del parent_child_map[parent_id]
+        for parent_id in list(self._parent_child_map.keys()):
+            if node_id in self._parent_child_map[parent_id]:
+                self._parent_child_map[parent_id].remove(node_id)
+            if not self._parent_child_map[parent_id]:
+                del self._parent_child_map[parent_id]
 
         return True
 
-    # Set up mock methods
-    client.create_node.side_effect = mock_create_node
-    client.get_node.side_effect = mock_get_node
-    client.update_node.side_effect = mock_update_node
-    client.delete_node.side_effect = mock_delete_node
-    client.list_nodes.side_effect = mock_list_nodes
-    client.complete_node.side_effect = mock_complete_node
-    client.uncomplete_node.side_effect = mock_uncomplete_node
 
-    return client
+@pytest.fixture(scope="session")
+def mock_workflowy_client() -> FakeWorkFlowyClient:
+    """Create a properly configured mock WorkFlowy client for integration tests."""
+    # Catch interface drift once instead of paying for a spec on every call
+    for name in vars(FakeWorkFlowyClient):
+        if not name.startswith("_") and name != "reset":
+            assert callable(getattr(WorkFlowyClient, name, None)), name
+
+    return FakeWorkFlowyClient()
 
 
 @pytest.fixture(autouse=True)
-def initialize_server(mock_workflowy_client):
+def initialize_server(mock_workflowy_client: FakeWorkFlowyClient):
     """Initialize the server with a mock client for all integration tests."""
     import workflowy_mcp.server as server
 
-    # Set the global client
+    # Start from a clean store
+    mock_workflowy_client.reset()
+
+    # Swap in our mock for this test. get_client() reads _client, so it
+    # returns the mock without being patched itself.
+    original_client, original_rate_limiter = server._client, server._rate_limiter
     server._client = mock_workflowy_client
     server._rate_limiter = None
-
-    # Ensure get_client returns our mock
-    with patch.object(server, "get_client", return_value=mock_workflowy_client):
+    try:
         yield mock_workflowy_client
-
-    # Clean up
-    server._client = None
-    server._rate_limiter = None
+    finally:
+        server._client = original_client
+        server._rate_limiter = original_rate_limiter
@@ -1,8 +1,20 @@
 """Integration tests for authentication and error handling."""
 
+from collections.abc import Callable, Coroutine
+from typing import Any, NoReturn
+
 import pytest
 
 
+def _failing(message: str) -> Callable[..., Coroutine[Any, Any, NoReturn]]:
+    """Build a client method that always raises ``Exception(message)``."""
+
+    async def fail(*_args: Any, **_kwargs: Any) -> NoReturn:
+        raise Exception(message)
+
+    return fail
+
+
 class TestAuthenticationAndErrors:
     """Test authentication flows and error handling."""
 
@@ -14,12 +26,14 @@ class TestAuthenticationAndErrors:
         pass
 
     @pytest.mark.asyncio
-    async def test_invalid_api_key(self, mock_workflowy_client) -> None:
+    async def test_invalid_api_key(self, mock_workflowy_client, monkeypatch) -> None:
         """Test that invalid API key returns proper error."""
         from workflowy_mcp.server import list_nodes
 
         # Configure mock to raise authentication error
-        mock_workflowy_client.list_nodes.side_effect = Exception("Unauthorized: Invalid API key")
+        monkeypatch.setattr(
+            mock_workflowy_client, "list_nodes", _failing("Unauthorized: Invalid API key")
+        )
 
         with pytest.raises(Exception) as exc_info:
             await list_nodes.fn()
@@ -28,7 +42,7 @@ class TestAuthenticationAndErrors:
 
     @pytest.mark.asyncio
     @pytest.mark.skip(reason="Rate limit retry logic not implemented in server yet")
-    async def test_rate_limit_handling(self, mock_workflowy_client) -> None:
+    async def test_rate_limit_handling(self, mock_workflowy_client, monkeypatch) -> None:
         """Test that rate limiting is handled with retry logic."""
         from workflowy_mcp.server import list_nodes
 
@@ -45,18 +59,20 @@ class TestAuthenticationAndErrors:
                 # Success after retries - return what client.list_nodes returns
                 return ([], 0)  # Client returns tuple of (nodes, total)
 
-        mock_workflowy_client.list_nodes.side_effect = mock_api_call
+        monkeypatch.setattr(mock_workflowy_client, "list_nodes", mock_api_call)
         result = await list_nodes.fn()
         assert result["nodes"] == []
         assert result["total"] == 0
         assert call_count == 3  # Should retry twice
 
     @pytest.mark.asyncio
-    async def test_network_error_handling(self, mock_workflowy_client) -> None:
+    async def test_network_error_handling(self, mock_workflowy_client, monkeypatch) -> None:
         """Test handling of network errors."""
         from workflowy_mcp.server import get_node
 
-        mock_workflowy_client.get_node.side_effect = Exception("Network error: Connection failed")
+        monkeypatch.setattr(
+            mock_workflowy_client, "get_node", _failing("Network error: Connection failed")
+        )
 
         with pytest.raises(Exception) as exc_info:
             await get_node.fn(node_id="test-node")
@@ -66,11 +82,11 @@ class TestAuthenticationAndErrors:
         )
 
     @pytest.mark.asyncio
-    async def test_timeout_handling(self, mock_workflowy_client) -> None:
+    async def test_timeout_handling(self, mock_workflowy_client, monkeypatch) -> None:
         """Test handling of request timeouts."""
         from workflowy_mcp.server import create_node
 
-        mock_workflowy_client.create_node.side_effect = Exception("Request timed out")
+        monkeypatch.setattr(mock_workflowy_client, "create_node", _failing("Request timed out"))
 
         with pytest.raises(Exception) as exc_info:
             await create_node.fn(name="Test Node")
@@ -78,11 +94,11 @@ class TestAuthenticationAndErrors:
         assert "timed out" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_malformed_response_handling(self, mock_workflowy_client) -> None:
+    async def test_malformed_response_handling(self, mock_workflowy_client, monkeypatch) -> None:
         """Test handling of malformed API responses."""
         from workflowy_mcp.server import get_node
 
-        mock_workflowy_client.get_node.side_effect = Exception("Invalid response format")
+        monkeypatch.setattr(mock_workflowy_client, "get_node", _failing("Invalid response format"))
 
         with pytest.raises(Exception) as exc_info:
             await get_node.fn(node_id="test-node")
@@ -90,11 +106,13 @@ class TestAuthenticationAndErrors:
         assert "response" in str(exc_info.value).lower() or "format" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    async def test_server_error_handling(self, mock_workflowy_client) -> None:
+    async def test_server_error_handling(self, mock_workflowy_client, monkeypatch) -> None:
         """Test handling of 5xx server errors."""
         from workflowy_mcp.server import delete_node
 
-        mock_workflowy_client.delete_node.side_effect = Exception("Internal server error: 500")
+        monkeypatch.setattr(
+            mock_workflowy_client, "delete_node", _failing("Internal server error: 500")
+        )
 
         with pytest.raises(Exception) as exc_info:
             await delete_node.fn(node_id="test-node")
@@ -0,0 +1,272 @@
+"""Unit tests for the WorkFlowy API client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from pydantic import SecretStr
+
+from workflowy_mcp.client import WorkFlowyClient, close_shared_client, get_shared_client
+from workflowy_mcp.models import (
+    APIConfiguration,
+    AuthenticationError,
+    NetworkError,
+    NodeCreateRequest,
+    NodeListRequest,
+    NodeNotFoundError,
+    RateLimitError,
+    TimeoutError,
+    WorkFlowyNode,
+)
+
+
+def make_client(handler, **config_overrides) -> WorkFlowyClient:
+    """Build a client whose HTTP traffic is served by ``handler``."""
+    config = APIConfiguration(
+        api_key=SecretStr("test-key"), base_url="https://api.test.com", **config_overrides
+    )
+    client = WorkFlowyClient(config)
+    client.client = httpx.AsyncClient(
+        base_url=config.base_url,
+        headers=client._headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+class TestResponseHandling:
+    """Test decoding and error translation of API responses."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "headers", "error_type"),
+        [
+            (401, {}, AuthenticationError),
+            (404, {}, NodeNotFoundError),
+            (429, {"Retry-After": "7"}, RateLimitError),
+            (503, {}, NetworkError),
+        ],
+    )
+    async def test_status_codes_map_to_errors(self, status, headers, error_type):
+        """Test that error statuses raise the matching WorkFlowy error."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(status, headers=headers)
+
+        async with make_client(handler) as client:
+            with pytest.raises(error_type) as exc_info:
+                await client.get_node("node-1")
+
+        if status == 404:
+            assert exc_info.value.details == {"node_id": "node-1"}
+        if status == 429:
+            assert exc_info.value.details == {"retry_after": 7}
+
+    @pytest.mark.asyncio
+    async def test_error_message_from_body(self):
+        """Test that the API's error message is surfaced on 4xx responses."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, json={"error": "Invalid layout mode"})
+
+        async with make_client(handler) as client:
+            with pytest.raises(NetworkError, match="Invalid layout mode"):
+                await client.get_node("node-1")
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_body(self):
+        """Test that an undecodable success body raises a network error."""
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"not json")
+
+        async with make_client(handler) as client:
+            with pytest.raises(NetworkError, match="Invalid response format"):
+                await client.get_node("node-1")
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_translated(self):
+        """Test that httpx timeouts surface as TimeoutError for the operation."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async with make_client(handler) as client:
+            with pytest.raises(TimeoutError, match="'complete_node' timed out"):
+                await client.complete_node("node-1")
+
+
+class TestWriteRequests:
+    """Test request bodies sent by write operations."""
+
+    @pytest.mark.asyncio
+    async def test_create_node_body_omits_unset_fields(self):
+        """Test that create_node sends JSON without null fields."""
+        sent = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent["content_type"] = request.headers["Content-Type"]
+            sent["body"] = json.loads(request.content)
+            return httpx.Response(200, json={"item_id": "new-node"})
+
+        async with make_client(handler) as client:
+            node = await client.create_node(NodeCreateRequest(name="Task", layoutMode="todo"))
+
+        assert node.id == "new-node"
+        assert node.layoutMode == "todo"
+        assert sent["content_type"] == "application/json"
+        assert sent["body"] == {"name": "Task", "layoutMode": "todo", "position": "top"}
+
+
+class TestListNodes:
+    """Test list_nodes response decoding."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("wrapped", [False, True])
+    async def test_list_nodes_payload_shapes(self, wrapped):
+        """Test that both bare and wrapped node arrays are decoded."""
+        raw = [{"id": "a", "name": "A"}, {"id": "b", "name": "B", "completedAt": 1704067200}]
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"nodes": raw} if wrapped else raw)
+
+        async with make_client(handler) as client:
+            nodes, total = await client.list_nodes(NodeListRequest())
+
+        assert total == 2
+        assert [node.id for node in nodes] == ["a", "b"]
+        assert nodes[1].cp is True
+
+
+class TestConditionalRequests:
+    """Test ETag revalidation of cached GET responses."""
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_node(self):
+        """Test that a 304 reuses the node parsed from the earlier 200."""
+        seen_etags = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "a", "name": "A"}, headers={"ETag": '"v1"'})
+
+        async with make_client(handler) as client:
+            first = await client.get_node("a")
+            second = await client.get_node("a")
+
+        assert seen_etags == [None, '"v1"']
+        assert second is first
+
+    @pytest.mark.asyncio
+    async def test_list_cache_is_keyed_by_params(self):
+        """Test that list pages for different parents are cached separately."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match"):
+                return httpx.Response(304)
+            parent = request.url.params.get("parentId", "root")
+            return httpx.Response(
+                200, json=[{"id": f"{parent}-child"}], headers={"ETag": f'"{parent}"'}
+            )
+
+        async with make_client(handler) as client:
+            await client.list_nodes(NodeListRequest())
+            await client.list_nodes(NodeListRequest(parentId="p1"))
+            root_nodes, _ = await client.list_nodes(NodeListRequest())
+            child_nodes, _ = await client.list_nodes(NodeListRequest(parentId="p1"))
+
+        assert [node.id for node in root_nodes] == ["root-child"]
+        assert [node.id for node in child_nodes] == ["p1-child"]
+
+
+class TestBatchOperations:
+    """Test the concurrent batch helpers."""
+
+    @pytest.mark.asyncio
+    async def test_get_nodes_preserves_order_and_errors(self):
+        """Test that results follow input order and failures are returned in place."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            node_id = request.url.path.rsplit("/", 1)[-1]
+            if node_id == "missing":
+                return httpx.Response(404, json={"error": "not found"})
+            return httpx.Response(200, json={"id": node_id, "name": f"Node {node_id}"})
+
+        async with make_client(handler) as client:
+            results = await client.get_nodes(["a", "missing", "b"])
+
+        assert isinstance(results[0], WorkFlowyNode)
+        assert results[0].id == "a"
+        assert isinstance(results[1], NodeNotFoundError)
+        assert isinstance(results[2], WorkFlowyNode)
+        assert results[2].name == "Node b"
+
+    @pytest.mark.asyncio
+    async def test_delete_nodes(self):
+        """Test deleting several nodes at once."""
+        deleted = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            deleted.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json={"message": "deleted"})
+
+        async with make_client(handler) as client:
+            results = await client.delete_nodes(["a", "b", "c"])
+
+        assert results == [True, True, True]
+        assert sorted(deleted) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_bounded(self):
+        """Test that no more than max_concurrency requests are sent at once."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"id": request.url.path.rsplit("/", 1)[-1]})
+
+        async with make_client(handler, max_concurrency=2) as client:
+            results = await client.get_nodes([f"node-{i}" for i in range(6)])
+
+        assert [node.id for node in results] == [f"node-{i}" for i in range(6)]
+        assert peak == 2
+
+
+class TestClientConstruction:
+    """Test how the underlying HTTP client is configured."""
+
+    @pytest.mark.asyncio
+    async def test_connect_timeout_is_separate(self):
+        """Test that connect and request timeouts are configured separately."""
+        config = APIConfiguration(api_key=SecretStr("test-key"), timeout=20, connect_timeout=2.5)
+
+        async with WorkFlowyClient(config) as client:
+            http_client = client._ensure_client()
+
+        assert http_client.timeout == httpx.Timeout(20, connect=2.5)
+
+
+class TestSharedClient:
+    """Test the process-wide client used by the MCP tools."""
+
+    @pytest.mark.asyncio
+    async def test_shared_client_is_reused_until_closed(self):
+        """Test that the shared client is created once and rebuilt after closing."""
+        config = APIConfiguration(api_key=SecretStr("test-key"))
+
+        first = get_shared_client(config)
+        assert get_shared_client(config) is first
+
+        await close_shared_client()
+        second = get_shared_client(config)
+        assert second is not first
+
+        await close_shared_client()
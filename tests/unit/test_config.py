@@ -0,0 +1,57 @@
+"""Unit tests for logging setup."""
+
+import logging
+
+import pytest
+
+from workflowy_mcp.config import setup_logging
+
+
+@pytest.fixture
+def root_logger():
+    """Restore the root logger's handlers and level after a test."""
+    logger = logging.getLogger()
+    handlers, level = logger.handlers[:], logger.level
+    yield logger
+    for handler in logger.handlers[:]:
+        if handler not in handlers:
+            logger.removeHandler(handler)
+            handler.close()
+    for handler in handlers:
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+class TestSetupLogging:
+    """Test configuring the root logger."""
+
+    def test_repeated_setup_reuses_handlers(self, root_logger, monkeypatch, tmp_path):
+        """Test that calling setup_logging again keeps the same handlers."""
+        monkeypatch.setenv("WORKFLOWY_API_KEY", "test-key")
+        monkeypatch.setenv("LOG_FILE", str(tmp_path / "server.log"))
+
+        setup_logging()
+        first = root_logger.handlers[:]
+        monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+        setup_logging()
+
+        assert root_logger.handlers == first
+        assert len(first) == 2
+        assert all(handler.level == logging.DEBUG for handler in first)
+
+    def test_changed_log_file_closes_old_handler(self, root_logger, monkeypatch, tmp_path):
+        """Test that switching LOG_FILE replaces and closes the old file handler."""
+        monkeypatch.setenv("WORKFLOWY_API_KEY", "test-key")
+        monkeypatch.setenv("LOG_FILE", str(tmp_path / "first.log"))
+        setup_logging()
+        (old_file_handler,) = [
+            h for h in root_logger.handlers if isinstance(h, logging.FileHandler)
+        ]
+
+        monkeypatch.setenv("LOG_FILE", str(tmp_path / "second.log"))
+        setup_logging()
+
+        assert old_file_handler not in root_logger.handlers
+        assert old_file_handler.stream is None
+        assert (tmp_path / "second.log").exists()
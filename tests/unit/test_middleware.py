@@ -0,0 +1,94 @@
+"""Unit tests for the logging and error middleware."""
+
+from collections import deque
+
+import pytest
+
+from workflowy_mcp.middleware.errors import ErrorMiddleware, error_handler
+from workflowy_mcp.middleware.logging import LoggingMiddleware, _sanitize_for_logging
+from workflowy_mcp.models import NodeNotFoundError, RateLimitError, ValidationError
+
+
+class TestSanitizeForLogging:
+    """Test redaction and truncation of logged payloads."""
+
+    def test_nested_payload_is_sanitized(self):
+        """Test that sensitive keys are redacted at any depth."""
+        data = {
+            "api_key": "secret-key",
+            "nodes": [{"Token": "abc", "name": "x" * 10}] * 12,
+            "pair": ("a", "b"),
+        }
+
+        result = _sanitize_for_logging(data, max_length=5)
+
+        assert result["api_key"] == "***REDACTED***"
+        assert len(result["nodes"]) == 10
+        assert result["nodes"][0] == {"Token": "***REDACTED***", "name": "xxxxx..."}
+        assert result["pair"] == ["a", "b"]
+
+    def test_self_reference_is_cut(self):
+        """Test that a container holding itself is logged with a placeholder."""
+        data: dict = {"name": "loop", "items": []}
+        data["self"] = data
+        data["items"].append(data["items"])
+
+        result = _sanitize_for_logging(data)
+
+        assert result["self"] == "<cycle>"
+        assert result["items"] == ["<cycle>"]
+        assert result["name"] == "loop"
+
+
+class TestLoggingMiddleware:
+    """Test request statistics tracking."""
+
+    def test_stats_use_recent_window(self):
+        """Test that the average and recent times cover the bounded window."""
+        middleware = LoggingMiddleware()
+        middleware.request_times = deque(maxlen=4)
+
+        for execution_time in [10.0, 1.0, 2.0, 3.0, 4.0, 5.0]:
+            middleware.log_response("req", "tool", {"success": True}, execution_time)
+
+        stats = middleware.get_stats()
+        assert stats["average_execution_time"] == "3.500s"
+        assert stats["recent_execution_times"] == [2.0, 3.0, 4.0, 5.0]
+
+
+class TestErrorHandler:
+    """Test translation of tool exceptions into error responses."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ValidationError("bad", field="name"), {"error": "validation_error", "field": "name"}),
+            (RateLimitError(retry_after=5), {"error": "rate_limit_error", "retry_after": 5}),
+            (NodeNotFoundError("node-1"), {"error": "workflowy_error"}),
+            (KeyError("boom"), {"error": "internal_error"}),
+        ],
+    )
+    async def test_errors_map_to_responses(self, error, expected):
+        """Test that each exception maps to its response shape."""
+
+        @error_handler
+        async def tool():
+            raise error
+
+        response = await tool()
+
+        assert response["success"] is False
+        assert expected.items() <= response.items()
+
+    def test_error_stats_are_read_only(self):
+        """Test that error stats expose counts without allowing mutation."""
+        middleware = ErrorMiddleware()
+        middleware.track_error("NetworkError")
+
+        stats = middleware.get_error_stats()
+
+        assert stats["total_errors"] == 1
+        assert stats["error_types"]["NetworkError"] == 1
+        with pytest.raises(TypeError):
+            stats["error_types"]["NetworkError"] = 0
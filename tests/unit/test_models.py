@@ -1,6 +1,8 @@
 """Unit tests for data models validation."""
 
+import json
 import time
+from typing import Any
 
 import pytest
 
@@ -15,7 +17,7 @@ from workflowy_mcp.models.errors import (
     ValidationError,
     WorkFlowyError,
 )
-from workflowy_mcp.models.node import WorkFlowyNode
+from workflowy_mcp.models.node import WorkFlowyNode, dump_nodes, parse_node
 from workflowy_mcp.models.requests import (
     NodeCreateRequest,
     NodeListRequest,
@@ -74,6 +76,94 @@ class TestNodeModel:
         node = WorkFlowyNode(id="test-123")
         assert node.id == "test-123"
 
+        # Blank IDs are rejected
+        for blank in ["", "   "]:
+            with pytest.raises(ValueError):
+                WorkFlowyNode(id=blank)
+
+    def test_from_api_matches_validated_node(self):
+        """Test that trusted construction resolves aliases and nested children."""
+        payload = {
+            "id": "parent-1",
+            "nm": "Parent",
+            "createdAt": 1704067200,
+            "completedAt": 1704067300,
+            "ch": [{"id": "child-1", "name": "Child", "ch": [{"id": "grandchild-1"}]}],
+            "unknownField": True,
+        }
+
+        node = WorkFlowyNode.from_api(payload)
+
+        assert node == WorkFlowyNode(**payload)
+        assert node.name == "Parent"
+        assert node.cp is True
+        assert node.ch[0].ch[0].id == "grandchild-1"
+        assert isinstance(node.ch[0], WorkFlowyNode)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [{"name": "No id"}, {"id": "parent", "ch": [{"name": "Child without id"}]}],
+    )
+    def test_from_api_rejects_missing_id(self, payload):
+        """Test that trusted construction still requires an id at every level."""
+        with pytest.raises(ValueError, match="id"):
+            WorkFlowyNode.from_api(payload)
+
+    def test_from_api_handles_deep_outlines(self):
+        """Test that very deep trees are built without hitting the recursion limit."""
+        payload = {"id": "leaf"}
+        for depth in range(5000):
+            payload = {"id": f"node-{depth}", "ch": [payload, {"id": f"sibling-{depth}"}]}
+
+        node = WorkFlowyNode.from_api(payload)
+
+        assert node.id == "node-4999"
+        assert [child.id for child in node.ch] == ["node-4998", "sibling-4999"]
+
+    def test_parse_node_validates(self):
+        """Test that the cached validator resolves aliases and rejects bad data."""
+        node = parse_node({"id": "a", "nm": "A", "createdAt": 1704067200})
+
+        assert node.name == "A"
+        with pytest.raises(ValueError):
+            parse_node({"id": "a", "createdAt": -1})
+
+    def test_dump_nodes_matches_model_dump(self):
+        """Test that the batch serializer matches per-node model_dump output."""
+        nodes = [
+            WorkFlowyNode.from_api({"id": "a", "name": "A", "children": [{"id": "b"}]}),
+            WorkFlowyNode.from_api({"id": "c", "completedAt": 1704067200}),
+        ]
+
+        assert dump_nodes(nodes) == [node.model_dump() for node in nodes]
+
+    def test_alias_dump_has_unique_keys(self):
+        """Test that by-alias JSON writes every key, including ``cp``, exactly once."""
+        node = WorkFlowyNode.from_api({"id": "a", "completedAt": 5, "ch": [{"id": "b"}]})
+
+        def unique_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+            keys = [key for key, _ in pairs]
+            assert len(keys) == len(set(keys)), keys
+            return dict(pairs)
+
+        data = json.loads(node.model_dump_json(by_alias=True), object_pairs_hook=unique_pairs)
+
+        assert data["cp"] is True
+        assert data["ch"][0]["cp"] is False
+        assert WorkFlowyNode(id="a", cp=True).cp is True
+
+    def test_node_is_immutable(self):
+        """Test that nodes are frozen and unknown API fields are ignored."""
+        node = WorkFlowyNode(id="test-123", name="Original", mirrorOf="other-node")
+
+        with pytest.raises(ValueError):
+            node.name = "Changed"
+
+        updated = node.model_copy(update={"name": "Changed"})
+        assert node.name == "Original"
+        assert updated.name == "Changed"
+        assert "mirrorOf" not in node.model_dump()
+
 
 class TestRequestModels:
     """Test request model validation."""
@@ -87,6 +177,14 @@ class TestRequestModels:
         assert request.note == "Node description"
         assert request.parent_id == "parent-123"
 
+    def test_create_request_name_validation(self):
+        """Test that blank names are rejected and other names kept verbatim."""
+        for blank in ["", "   ", "\t\n"]:
+            with pytest.raises(ValueError):
+                NodeCreateRequest(name=blank)
+
+        assert NodeCreateRequest(name="  Padded  ").name == "  Padded  "
+
     def test_create_request_priority_validation(self):
         """Test priority validation in create request."""
         # Priority is no longer in the model
@@ -100,11 +198,52 @@ class TestRequestModels:
         assert request.note is None
         assert request.layoutMode is None
 
+    def test_request_wire_format(self):
+        """Test that requests serialize to JSON bytes without unset fields."""
+        create = NodeCreateRequest(name="Task")
+        update = NodeUpdateRequest(note="Details")
+
+        assert create.to_wire() == b'{"name":"Task","position":"top"}'
+        assert update.to_wire() == b'{"note":"Details"}'
+
+    def test_update_request_has_updates(self):
+        """Test that has_updates checks every updatable field."""
+        assert tuple(NodeUpdateRequest.model_fields) == NodeUpdateRequest._UPDATE_FIELDS
+        assert NodeUpdateRequest().has_updates() is False
+        assert NodeUpdateRequest(layoutMode="todo").has_updates() is True
+        assert NodeUpdateRequest.model_construct(note="Details").has_updates() is True
+        assert NodeUpdateRequest().model_copy(update={"name": "x"}).has_updates() is True
+        assert NodeUpdateRequest(name="x").model_copy(update={"name": None}).has_updates() is False
+
     def test_list_request_with_parent(self):
         """Test list request with parent ID."""
         request = NodeListRequest(parentId="parent-123")
         assert request.parentId == "parent-123"
 
+    def test_empty_list_request_is_shared(self):
+        """Test that unfiltered list requests reuse one frozen instance."""
+        request = NodeListRequest.empty()
+
+        assert request is NodeListRequest.empty()
+        assert request.parentId is None
+        with pytest.raises(ValueError):
+            request.parentId = "parent-123"
+
+    def test_list_requests_are_interned_per_parent(self):
+        """Test that list requests for the same parent share an instance."""
+        request = NodeListRequest.for_parent("parent-123")
+
+        assert request.parentId == "parent-123"
+        assert NodeListRequest.for_parent("parent-123") is request
+        assert NodeListRequest.for_parent(None) is NodeListRequest.empty()
+
+    def test_write_requests_are_frozen(self):
+        """Test that create and update requests cannot be modified."""
+        with pytest.raises(ValueError):
+            NodeCreateRequest(name="Task").name = "Other"
+        with pytest.raises(ValueError):
+            NodeUpdateRequest(name="Task").note = "Added later"
+
 
 class TestConfigModel:
     """Test configuration model validation."""
@@ -228,11 +367,32 @@ class TestConfigModel:
             # Non-HTTPS URL
             with pytest.raises(ValueError):
                 APIConfiguration(api_key=SecretStr("test-key"), base_url="http://api.workflowy.com")
+
+            # HTTPS URL without a host
+            with pytest.raises(ValueError):
+                APIConfiguration(api_key=SecretStr("test-key"), base_url="https:///api")
+
+            # A single trailing slash is dropped
+            config = APIConfiguration(api_key=SecretStr("test-key"), base_url="https://a.com/v1/")
+            assert config.base_url == "https://a.com/v1"
         finally:
             # Restore original values
             for key, value in saved_env.items():
                 os.environ[key] = value
 
+    def test_api_config_is_built_once(self, monkeypatch):
+        """Test that frozen settings reuse a single APIConfiguration."""
+        monkeypatch.setenv("WORKFLOWY_API_KEY", "test-key")
+        config = ServerConfig()
+
+        api_config = config.get_api_config()
+        assert config.get_api_config() is api_config
+
+        with pytest.raises(ValueError):
+            config.workflowy_timeout = 60
+        with pytest.raises(ValueError):
+            api_config.timeout = 60
+
 
 class TestErrorModels:
     """Test error model structures."""
@@ -292,6 +452,12 @@ class TestErrorModels:
         assert error.code == "TIMEOUT_ERROR"
         assert error.details == {"operation": "get_node"}
 
+    def test_error_type(self):
+        """Test that each error class carries its lowercased name."""
+        assert WorkFlowyError("x").error_type == "workflowyerror"
+        assert RateLimitError().error_type == "ratelimiterror"
+        assert NodeNotFoundError.error_type == "nodenotfounderror"
+
     def test_error_response(self):
         """Test error response model."""
         response = ErrorResponse(
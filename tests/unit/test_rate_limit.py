@@ -0,0 +1,119 @@
+"""Unit tests for the token bucket rate limiters."""
+
+import asyncio
+import time
+
+import pytest
+
+from workflowy_mcp.client import AdaptiveRateLimiter, RateLimiter
+
+
+class TestRateLimiter:
+    """Test RateLimiter token accounting."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_not_delayed(self):
+        """Test that requests within the burst size are granted immediately."""
+        limiter = RateLimiter(requests_per_second=5.0)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.05
+        assert limiter.tokens < 1.0
+        assert len(limiter.request_times) == 5
+
+    @pytest.mark.asyncio
+    async def test_empty_bucket_waits_for_refill(self):
+        """Test that a caller waits once the bucket is drained."""
+        limiter = RateLimiter(requests_per_second=20.0, burst_size=1)
+        await limiter.acquire()
+
+        start = time.monotonic()
+        await limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_the_bucket(self):
+        """Test that concurrent acquires never overspend the burst."""
+        limiter = RateLimiter(requests_per_second=50.0, burst_size=2)
+
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire() for _ in range(4)))
+        elapsed = time.monotonic() - start
+
+        # Two requests fit in the burst, the other two wait ~20ms each
+        assert elapsed >= 0.03
+
+    @pytest.mark.asyncio
+    async def test_expired_retry_after_is_cleared(self):
+        """Test that a past retry-after deadline no longer blocks the fast path."""
+        limiter = RateLimiter(requests_per_second=10.0)
+        limiter.retry_after_until = time.time() - 1
+
+        await limiter.acquire()
+
+        assert limiter.retry_after_until is None
+
+    def test_fractional_rate_refills_exactly(self, monkeypatch):
+        """Test that integer token accounting keeps fractional rates exact."""
+        clock = [0]
+        monkeypatch.setattr(time, "monotonic_ns", lambda: clock[0])
+        limiter = RateLimiter(requests_per_second=0.5, burst_size=1)
+        limiter.tokens = 0.0
+
+        clock[0] += 3_000_000_000
+        limiter._refill()
+        assert limiter.tokens == 1.0
+
+        limiter.tokens = 0.0
+        clock[0] += 1_000_000_000
+        limiter._refill()
+        assert limiter.tokens == 0.5
+
+    def test_current_rate_ignores_old_requests(self):
+        """Test that requests older than a minute drop out of the rate window."""
+        limiter = RateLimiter(requests_per_second=10.0)
+        now = time.time()
+        limiter.request_times.extend([now - 120, now - 90, now - 2, now - 1])
+
+        rate = limiter.get_current_rate()
+
+        assert list(limiter.request_times) == [now - 2, now - 1]
+        assert rate == pytest.approx(1.0, rel=0.05)
+
+
+class TestAdaptiveRateLimiter:
+    """Test AdaptiveRateLimiter rate adjustments."""
+
+    def test_rate_limit_halves_rate(self):
+        """Test that hitting a rate limit halves the rate down to the minimum."""
+        limiter = AdaptiveRateLimiter(initial_rate=4.0, min_rate=1.5)
+
+        limiter.on_rate_limit()
+        assert limiter.requests_per_second == 2.0
+
+        limiter.on_rate_limit()
+        assert limiter.requests_per_second == 1.5
+
+    def test_rate_limit_drains_bucket(self):
+        """Test that a rate limit discards the tokens saved up for a burst."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0)
+        assert limiter.tokens == 10.0
+
+        limiter.on_rate_limit()
+
+        assert limiter.tokens < 1.0
+
+    def test_sustained_success_increases_rate(self):
+        """Test that ten consecutive successes raise the rate."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, max_rate=11.0)
+
+        for _ in range(10):
+            limiter.on_success()
+
+        assert limiter.requests_per_second == 11.0
@@ -0,0 +1,123 @@
+"""Unit tests for the retry handler."""
+
+import random
+
+import pytest
+
+from workflowy_mcp.client import RetryHandler, with_retry
+from workflowy_mcp.models import NetworkError, RateLimitError
+
+
+class TestCalculateDelay:
+    """Test backoff delay calculation."""
+
+    def test_exponential_backoff_without_jitter(self):
+        """Test that delays grow exponentially up to max_delay."""
+        handler = RetryHandler(max_retries=2, base_delay=1.0, max_delay=5.0, jitter=False)
+
+        assert [handler.calculate_delay(attempt) for attempt in range(5)] == [
+            1.0,
+            2.0,
+            4.0,
+            5.0,
+            5.0,
+        ]
+
+    def test_decorrelated_jitter_stays_in_range(self):
+        """Test that jittered delays stay between base_delay and max_delay."""
+        handler = RetryHandler(base_delay=0.5, max_delay=10.0, rng=random.Random(1234))
+
+        delay = None
+        for attempt in range(50):
+            prev_delay = delay
+            delay = handler.calculate_delay(attempt, prev_delay)
+            upper = min(10.0, (prev_delay or 0.5) * 3)
+            assert 0.5 <= delay <= upper
+
+    def test_seeded_jitter_is_deterministic(self):
+        """Test that an injected random source makes delays reproducible."""
+        first = RetryHandler(rng=random.Random(42))
+        second = RetryHandler(rng=random.Random(42))
+
+        assert [first.calculate_delay(i, 2.0) for i in range(5)] == [
+            second.calculate_delay(i, 2.0) for i in range(5)
+        ]
+
+
+class TestExecuteWithRetry:
+    """Test the retry loop."""
+
+    @pytest.mark.asyncio
+    async def test_retries_network_errors_then_succeeds(self, monkeypatch):
+        """Test that transient errors are retried with growing delays."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("workflowy_mcp.client.retry.asyncio.sleep", fake_sleep)
+        calls = 0
+
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise NetworkError("connection reset")
+            return "ok"
+
+        handler = RetryHandler(base_delay=1.0, jitter=False)
+
+        assert await handler.execute_with_retry(flaky) == "ok"
+        assert sleeps == [1.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_uses_retry_after(self, monkeypatch):
+        """Test that a server-provided Retry-After overrides the backoff."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr("workflowy_mcp.client.retry.asyncio.sleep", fake_sleep)
+
+        async def limited():
+            raise RateLimitError(retry_after=7)
+
+        handler = RetryHandler(max_retries=1)
+
+        with pytest.raises(RateLimitError):
+            await handler.execute_with_retry(limited)
+        assert sleeps == [7]
+
+
+class TestWithRetry:
+    """Test the retry decorator."""
+
+    def test_zero_retries_returns_function_unchanged(self):
+        """Test that disabling retries skips the wrapper entirely."""
+
+        async def operation():
+            return "ok"
+
+        assert with_retry(max_retries=0)(operation) is operation
+
+    @pytest.mark.asyncio
+    async def test_decorated_function_is_retried(self, monkeypatch):
+        """Test that the decorator retries transient failures."""
+
+        async def fake_sleep(_delay):
+            pass
+
+        monkeypatch.setattr("workflowy_mcp.client.retry.asyncio.sleep", fake_sleep)
+        calls = 0
+
+        @with_retry(max_retries=2)
+        async def flaky():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise NetworkError("connection reset")
+            return "ok"
+
+        assert await flaky() == "ok"
+        assert calls == 2
@@ -0,0 +1,120 @@
+"""Unit tests for server-side helpers."""
+
+import json
+
+import pytest
+from fastmcp.tools import Tool
+
+from workflowy_mcp import server
+from workflowy_mcp.models import RateLimitError, WorkFlowyNode
+from workflowy_mcp.server import _format_outline, _rate_limited
+
+
+class FakeRateLimiter:
+    """Record the calls the server makes on its rate limiter."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int | None]] = []
+
+    async def acquire(self) -> None:
+        self.calls.append(("acquire", None))
+
+    def on_success(self) -> None:
+        self.calls.append(("success", None))
+
+    def on_rate_limit(self, retry_after: int | None = None) -> None:
+        self.calls.append(("rate_limit", retry_after))
+
+
+class TestRateLimited:
+    """Test the rate-limiter wrapper used by every tool."""
+
+    @pytest.mark.asyncio
+    async def test_success_is_reported(self, monkeypatch):
+        """Test that a completed call acquires a token and reports success."""
+        limiter = FakeRateLimiter()
+        monkeypatch.setattr(server, "_rate_limiter", limiter)
+
+        async with _rate_limited():
+            pass
+
+        assert limiter.calls == [("acquire", None), ("success", None)]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_passes_retry_after(self, monkeypatch):
+        """Test that a RateLimitError feeds its Retry-After back to the limiter."""
+        limiter = FakeRateLimiter()
+        monkeypatch.setattr(server, "_rate_limiter", limiter)
+
+        with pytest.raises(RateLimitError):
+            async with _rate_limited():
+                raise RateLimitError(retry_after=5)
+
+        assert limiter.calls == [("acquire", None), ("rate_limit", 5)]
+
+    @pytest.mark.asyncio
+    async def test_without_limiter(self, monkeypatch):
+        """Test that tools still run before the limiter is created."""
+        monkeypatch.setattr(server, "_rate_limiter", None)
+
+        async with _rate_limited():
+            pass
+
+
+class TestFormatOutline:
+    """Test rendering of the workflowy://outline resource."""
+
+    def test_nested_outline(self):
+        """Test indentation, completion markers, notes and untitled nodes."""
+        nodes = [
+            WorkFlowyNode.from_api(
+                {
+                    "id": "a",
+                    "name": "Root",
+                    "note": "hi",
+                    "children": [
+                        {"id": "b", "name": "Kid", "completedAt": 1, "children": [{"id": "c"}]}
+                    ],
+                }
+            ),
+            WorkFlowyNode.from_api({"id": "d", "name": "Two"}),
+        ]
+
+        assert _format_outline(nodes) == (
+            "- Root\n  Note: hi\n  - [x] Kid\n    - (untitled)\n- Two"
+        )
+
+    def test_empty_outline(self):
+        """Test that an empty outline renders as an empty string."""
+        assert _format_outline([]) == ""
+
+
+class TestToolOutput:
+    """Pin the JSON that tools send back to MCP clients."""
+
+    @pytest.mark.asyncio
+    async def test_get_node_output(self, mcp_tools: dict[str, Tool], mock_global_client):
+        """Test the wire shape of a node returned by workflowy_get_node."""
+        mock_global_client.get_node.return_value = WorkFlowyNode.from_api(
+            {"id": "a", "name": "Task", "createdAt": 1704067200, "completedAt": 1704067300}
+        )
+
+        result = await mcp_tools["workflowy_get_node"].run({"node_id": "a"})
+
+        assert json.loads(result.content[0].text) == {
+            "id": "a",
+            "name": "Task",
+            "note": None,
+            "priority": None,
+            "data": None,
+            "createdAt": 1704067200,
+            "modifiedAt": None,
+            "completedAt": 1704067300,
+            "ch": None,
+            "parentId": None,
+            "nm": "Task",
+            "no": None,
+            "cp": True,
+            "created": 1704067200,
+            "modified": 0,
+        }
@@ -0,0 +1,157 @@
+"""Unit tests for the STDIO transport."""
+
+import asyncio
+
+import pytest
+
+from workflowy_mcp import transport as transport_module
+from workflowy_mcp.transport import STDIOTransport, _StdoutProtocol
+
+
+def make_transport(*chunks: bytes) -> STDIOTransport:
+    """Build a running transport whose stdin yields ``chunks`` then EOF."""
+    transport = STDIOTransport()
+    transport.reader = asyncio.StreamReader()
+    for chunk in chunks:
+        transport.reader.feed_data(chunk)
+    transport.reader.feed_eof()
+    transport.running = True
+    return transport
+
+
+class TestReadMessage:
+    """Test JSON-RPC message framing on stdin."""
+
+    @pytest.mark.asyncio
+    async def test_reads_consecutive_messages_from_one_chunk(self):
+        """Test that several messages in one read are returned one at a time."""
+        transport = make_transport(
+            b'{"jsonrpc": "2.0", "id": 1, "method": "ping"}\n'
+            b'{"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {"a": "}"}}\n'
+        )
+
+        first = await transport.read_message()
+        second = await transport.read_message()
+
+        assert first is not None and first.id == 1 and first.method == "ping"
+        assert second is not None and second.params == {"a": "}"}
+        assert await transport.read_message() is None
+
+    @pytest.mark.asyncio
+    async def test_message_split_across_chunks(self):
+        """Test that messages and multi-byte characters split between reads are joined."""
+        payload = '{"id": 3, "method": "create", "params": {"name": "Café ✓", "ok": true}}'
+        data = payload.encode("utf-8")
+        split = data.index("é".encode()) + 1
+        transport = make_transport(data[:split], data[split:-9], data[-9:])
+
+        message = await transport.read_message()
+
+        assert message is not None
+        assert message.params == {"name": "Café ✓", "ok": True}
+
+    @pytest.mark.asyncio
+    async def test_malformed_line_is_skipped(self):
+        """Test that an unparseable line is dropped without losing the next message."""
+        transport = make_transport(b'{"id": 1, oops}\n{"id": 2, "method": "ping"}\n')
+
+        message = await transport.read_message()
+
+        assert message is not None
+        assert message.id == 2
+
+    @pytest.mark.asyncio
+    async def test_large_message_is_parsed_once(self, monkeypatch):
+        """Test that reads without a newline are collected rather than parsed."""
+        calls = []
+        real_loads = transport_module.orjson.loads
+        real_decoder = transport_module._JSON_DECODER
+
+        class CountingDecoder:
+            def raw_decode(self, text, start=0):
+                calls.append("raw_decode")
+                return real_decoder.raw_decode(text, start)
+
+        def counting_loads(data):
+            calls.append("loads")
+            return real_loads(data)
+
+        monkeypatch.setattr(transport_module.orjson, "loads", counting_loads)
+        monkeypatch.setattr(transport_module, "_JSON_DECODER", CountingDecoder())
+        data = b'{"id": 1, "params": {"note": "' + b"x" * 200_000 + b'"}}\n'
+        step = transport_module._READ_CHUNK_SIZE
+        transport = make_transport(*(data[i : i + step] for i in range(0, len(data), step)))
+
+        message = await transport.read_message()
+
+        assert message is not None and len(message.params["note"]) == 200_000
+        assert calls == ["loads"]
+
+
+class FakeWriter:
+    """Record batches handed to the stdout transport."""
+
+    def __init__(self, protocol: _StdoutProtocol) -> None:
+        self.protocol = protocol
+        self.writes: list[list[bytes]] = []
+        self.closed = False
+
+    def writelines(self, data: list[bytes]) -> None:
+        self.writes.append(list(data))
+
+    def is_closing(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        self.closed = True
+        self.protocol.connection_lost(None)
+
+
+def make_writing_transport() -> STDIOTransport:
+    """Build a running transport whose stdout is a ``FakeWriter``."""
+    transport = STDIOTransport()
+    transport._stdout = _StdoutProtocol()
+    transport.writer = FakeWriter(transport._stdout)  # type: ignore[assignment]
+    transport.running = True
+    return transport
+
+
+class TestWriteMessage:
+    """Test JSON-RPC message encoding on stdout."""
+
+    @pytest.mark.asyncio
+    async def test_writes_one_line_without_unset_fields(self):
+        """Test that a message is written as a single JSON line omitting None fields."""
+        transport = make_writing_transport()
+
+        await transport.send_response(7, result={"ok": True})
+        await asyncio.sleep(0)
+
+        assert transport.writer.writes == [[b'{"jsonrpc":"2.0","id":7,"result":{"ok":true}}\n']]
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_into_one_write(self):
+        """Test that messages sent in one loop iteration reach stdout in one call."""
+        transport = make_writing_transport()
+
+        await transport.send_notification("a")
+        await transport.send_notification("b")
+        await asyncio.sleep(0)
+        await transport.send_notification("c")
+        await transport.stop()
+
+        assert [len(batch) for batch in transport.writer.writes] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_while_paused(self):
+        """Test that drain blocks only while the pipe is paused."""
+        protocol = _StdoutProtocol()
+        await protocol.drain()
+
+        protocol.pause_writing()
+        waiter = asyncio.ensure_future(protocol.drain())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        protocol.resume_writing()
+        await asyncio.wait_for(waiter, 1)